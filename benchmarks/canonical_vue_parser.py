@@ -0,0 +1,73 @@
+"""
+Compares the fast parsing of canonical temperatures and durations to the
+parsing with quantulum.
+
+First, verifies that both give identical results (differential check) on
+generated strings and, optionally, on the strings of a file given as an
+argument (one temperature or duration per line, f.i. extracted from the
+training corpus). Then, reports the speedup.
+"""
+import itertools
+import random
+import sys
+import timeit
+from typing import Callable, List, Optional
+
+from smiles2actions.quantities.value_unit_entity import (
+    VUE, VUEParseError, _parse_vue, _parse_vue_with_quantulum
+)
+from smiles2actions.utils import load_list_from_file
+
+random.seed(42)
+
+numbers = [
+    '0', '1', '2', '3', '5', '7', '10', '12', '15', '16', '18', '20', '24', '25', '30', '45', '48',
+    '60', '72', '78', '90', '100', '110', '120', '150', '200', '0.5', '1.5', '2.5', '0.25', '3.33'
+] + [str(round(random.uniform(0, 200), random.randint(0, 2))) for _ in range(30)]
+signs = ['', '-']
+units = [
+    '°C', '°F', 'K', 'C', 'F', '°', 'degrees', 'ms', 's', 'sec', 'secs', 'second', 'seconds',
+    'min', 'min.', 'mins', 'minute', 'minutes', 'h', 'h.', 'hr', 'hrs', 'hour', 'hours', 'hours.',
+    'd', 'day', 'days', 'week', 'weeks', 'month', 'months', 'year', 'years', '° C', 'degC'
+]
+range_separators = ['-', '–', ' - ', ' – ', '- ', ' -', ' to ']
+
+
+def generated_strings() -> List[str]:
+    strings = [
+        f'{sign}{n}{space}{unit}'
+        for sign, n, space, unit in itertools.product(signs, numbers, ['', ' '], units)
+    ]
+    strings += [
+        f'{a}{separator}{b}{space}{unit}' for a, b, separator, space, unit in
+        itertools.product(numbers[:8], numbers[:8], range_separators, ['', ' '], units)
+    ]
+    return strings
+
+
+def parse(fn: Callable[[str], VUE], text: str) -> Optional[VUE]:
+    try:
+        return fn(text)
+    except VUEParseError:
+        return None
+
+
+strings = generated_strings()
+if len(sys.argv) > 1:
+    strings += load_list_from_file(sys.argv[1])
+
+mismatches = [
+    s for s in strings if parse(_parse_vue, s) != parse(_parse_vue_with_quantulum, s)
+]
+print(f'Differential check on {len(strings)} strings: {len(mismatches)} mismatches.')
+for s in mismatches[:10]:
+    print(f'  "{s}": {parse(_parse_vue, s)} != {parse(_parse_vue_with_quantulum, s)}')
+
+typical_strings = ['25 °C', '0 °C', '-78 °C', '100°C', '40-50 °C', '2 h', '10 min', '3 hours', '1.5 h']
+for name, fn in [('quantulum', _parse_vue_with_quantulum), ('fast path', _parse_vue)]:
+    number_calls = 10 if fn is _parse_vue_with_quantulum else 1000
+    seconds = min(
+        timeit.repeat(lambda: [parse(fn, s) for s in typical_strings], number=number_calls, repeat=3)
+    )
+    per_second = number_calls * len(typical_strings) / seconds
+    print(f'{name:<10} {per_second:12.0f} strings/s')
@@ -0,0 +1,80 @@
+"""
+Microbenchmark for MultipleCompoundDetector, on long names with many delimiters.
+
+Compares the current filtering of the splits to the previous one, where all
+the components were recomputed after the removal of every split.
+Verifies that both give identical candidates.
+
+Usage: python -m benchmarks.multiple_compound_detector [number_names]
+"""
+import random
+import sys
+import timeit
+from typing import List, Tuple
+
+from benchmarks.name_corpus import synthetic_names
+from smiles2actions.name_filters.multiple_compound_detector import MultipleCompoundDetector
+
+
+class LegacyMultipleCompoundDetector(MultipleCompoundDetector):
+    """Previous implementation of the filtering of the splits."""
+
+    def _filter_out_slices(self, slices: List[slice], name: str) -> List[slice]:
+        slices = list(slices)
+        current_number_slices = 0
+
+        while len(slices) != current_number_slices:
+            current_number_slices = len(slices)
+            slices_and_neighbors = self._slice_and_neighbors_for_split(name, slices)
+            for s, left, right in slices_and_neighbors:
+                separator = name[s]
+                if not self.keep_split(separator, left, right):
+                    slices.remove(s)
+                    break
+        return slices
+
+    def _slice_and_neighbors_for_split(self, name: str,
+                                       splits: List[slice]) -> List[Tuple[slice, str, str]]:
+        components = self._subcompounds_from_splits(name, splits)
+        return [(splits[i], components[i], components[i + 1]) for i in range(len(splits))]
+
+
+fragments = [
+    '2', '3', '4', 'N', 'tert', 'butyl', 'methyl', 'ethyl', 'chloro', '1H', 'indol', '(S)',
+    'amino', 'phenyl', 'oxo', 'HCl', 'water', 'THF', 'Pd/C', 'EtOAc', 'hexane', 'DMF', 'a', 'b',
+    'di', '(2-fluorophenyl)', '[1,2,4]triazolo', 'pyridin', '(III)', 'and', 'or',
+]
+delimiters = ['-', '-', '-', '–', ' - ', '/', ' / ', ', ', ' and ', ' in ', ' (', ') ', ':']
+
+
+def dash_rich_names(n: int, number_fragments: int, seed: int = 42) -> List[str]:
+    """Long names made of random fragments joined by (mostly dash) delimiters."""
+    rng = random.Random(seed)
+    names = []
+    for _ in range(n):
+        name = rng.choice(fragments)
+        for _ in range(number_fragments - 1):
+            name += rng.choice(delimiters) + rng.choice(fragments)
+        names.append(name)
+    return names
+
+
+number_names = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+name_sets = [
+    ('synthetic', synthetic_names(number_names)),
+    ('10 fragments', dash_rich_names(number_names, 10)),
+    ('40 fragments', dash_rich_names(number_names // 4, 40)),
+    ('160 fragments', dash_rich_names(number_names // 40, 160)),
+]
+
+legacy = LegacyMultipleCompoundDetector()
+current = MultipleCompoundDetector()
+
+for title, names in name_sets:
+    mismatches = [n for n in names if legacy.get_candidates(n) != current.get_candidates(n)]
+    print(f'{title}: equivalence check on {len(names)} names, {len(mismatches)} mismatches.')
+    for implementation, detector in [('before', legacy), ('after', current)]:
+        seconds = min(
+            timeit.repeat(lambda: [detector.get_candidates(n) for n in names], number=1, repeat=3)
+        )
+        print(f'  {implementation:<8} {1e6 * seconds / len(names):10.1f} µs per name')
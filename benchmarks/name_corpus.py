@@ -0,0 +1,29 @@
+"""
+Synthetic corpus of compound names for the benchmarks.
+"""
+import random
+from typing import List
+
+compounds = [
+    'water', 'HCl', 'sodium chloride', 'NaHCO3', 'ethyl acetate', 'DCM', 'methanol', 'Pd/C',
+    'tert-butyl 4-(2-chloroethyl)piperidine-1-carboxylate', '1H-indole', 'brine', 'NaOH',
+    'compound 12a', 'intermediate (IV)', 'iron(III) chloride', 'dry ice', 'sodium (s)',
+    '(S)-2-amino-3-methylbutanoic acid', 'acetic acid', 'THF', 'hexane/ethyl acetate (3:1)',
+]
+descriptors = [
+    '', '', '', '1M', '2 N', '10%', '~5 % w/v', 'sat.', 'saturated aqueous', 'conc.', 'dilute',
+    'anhydrous', 'dry', 'distilled', 'crude', 'ice-cold', 'hot', 'solid', 'liquid', 'a',
+    'about 3 M', 'half-saturated', 'glacial', 'absolute', 'pure', 'oven-dried',
+]
+suffixes = ['', '', '', ' solution', ' mixture', ' (g)', ' 3', ' (5b)', ' (1:1)', ' (0 °C)']
+
+
+def synthetic_names(n: int, seed: int = 42) -> List[str]:
+    """Names made of random descriptors, compounds, and suffixes."""
+    rng = random.Random(seed)
+    names = []
+    for _ in range(n):
+        prefix = ' '.join(rng.sample(descriptors, rng.randint(0, 2)))
+        name = f'{prefix} {rng.choice(compounds)}{rng.choice(suffixes)}'
+        names.append(name.strip())
+    return names
@@ -0,0 +1,82 @@
+"""
+Microbenchmark for NameNormalizer.
+
+Verifies that the compiled mode gives output identical to the previous
+implementation (one pass per substitution, three regexes for the Greek
+letters), for all the combinations of options, and compares their speed
+for the default normalizer.
+
+Usage: python -m benchmarks.name_normalizer [number_names]
+"""
+import itertools
+import random
+import re
+import sys
+import timeit
+from typing import List
+
+from benchmarks.name_corpus import synthetic_names
+from smiles2actions.name_normalizer import NameNormalizer
+from smiles2actions.regex_utils import alternation
+
+options = [
+    'normalize_subscripts', 'normalize_case', 'normalize_dashes', 'normalize_primes',
+    'normalize_greek_letters', 'normalize_potential_ocr_errors', 'remove_spaces', 'remove_dashes',
+    'remove_primes', 'remove_special_characters'
+]
+
+
+class LegacyNameNormalizer(NameNormalizer):
+    """Previous implementation of the substitutions that were modified."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.special_character_regex = re.compile(
+            alternation([c for c in '±↑⊐×°□®™●•·⋅˙‌'] + [r'\*'])
+        )
+
+    def normalize_greek_letters(self, name: str) -> str:
+        name = re.sub(r'\balpha\b', 'α', name)
+        name = re.sub(r'\bbeta\b', 'β', name)
+        name = re.sub(r'\bgamma\b', 'γ', name)
+        return name
+
+
+def random_names(n: int, seed: int = 42) -> List[str]:
+    """Names with many of the characters and words affected by the normalization."""
+    rng = random.Random(seed)
+    pieces = [
+        'alpha', 'beta', 'gamma', 'Alpha', 'alphabeta', 'Σ', 'ΑΣ', 'σ', 'İ', 'ẞ', 'I', 'l', '1',
+        '0', 'O', 'H₂O', '₁₂', '-', '–', '—', '−', '\xad', "'", 'ʹ', '′', '’', '″', 'ʺ', '±', '°',
+        '*', '‌', '·', ' ', ' ', 'acid', 'N', 'ﬁ', 'Å', 'é', '(', ')', ',', '_'
+    ]
+    return [''.join(rng.choice(pieces) for _ in range(rng.randint(0, 12))) for _ in range(n)]
+
+
+number_names = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+names = synthetic_names(number_names // 2) + random_names(number_names // 2)
+
+# All the combinations of options, on a subset of the names
+subset = names[:1000] + names[-1000:]
+mismatches = 0
+for values in itertools.product([False, True], repeat=len(options)):
+    kwargs = dict(zip(options, values))
+    legacy = LegacyNameNormalizer(**kwargs)
+    compiled = NameNormalizer(**kwargs, compiled=True)
+    mismatches += sum(legacy(name) != compiled(name) for name in subset)
+print(
+    f'Equivalence check for {2 ** len(options)} combinations of options '
+    f'on {len(subset)} names: {mismatches} mismatches.'
+)
+
+# Default normalizer, on all the names
+default_options = {option: True for option in options}
+default_options.update(normalize_dashes=False, normalize_primes=False)
+legacy = LegacyNameNormalizer(**default_options)
+compiled = NameNormalizer.default_normalizer()
+mismatches = sum(legacy(name) != compiled(name) for name in names)
+print(f'Equivalence check for the default normalizer on {len(names)} names: {mismatches} mismatches.')
+
+for title, normalizer in [('before', legacy), ('compiled', compiled)]:
+    seconds = min(timeit.repeat(lambda: [normalizer(n) for n in names], number=1, repeat=3))
+    print(f'{title:<10} {1e6 * seconds / len(names):8.3f} µs per name')
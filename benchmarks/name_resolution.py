@@ -0,0 +1,87 @@
+"""
+Counts the work done for resolving compound names to valid names, with
+NameSimplifier.simplify (stopping at the first simplification where all the
+names are valid) and with NameSimplifier.resolve.
+
+The filter invocations are counted with wrappers around the find_matches
+method of the filters of the CoreNameExtractor.
+
+Usage: python -m benchmarks.name_resolution [number_names]
+"""
+import random
+import sys
+import timeit
+from collections import Counter
+from typing import Callable, List, Optional
+
+from benchmarks.name_corpus import compounds, synthetic_names
+from smiles2actions.name_simplifier import NameSimplifier
+
+valid_names = set(compounds)
+
+
+def is_valid(name: str) -> bool:
+    return name in valid_names
+
+
+def resolve_with_simplify(simplifier: NameSimplifier, name: str) -> Optional[List[str]]:
+    for names in simplifier.simplify(name):
+        if all(is_valid(n) for n in names):
+            return names
+    return None
+
+
+def resolve_with_resolve(simplifier: NameSimplifier, name: str) -> Optional[List[str]]:
+    return simplifier.resolve(name, is_valid)
+
+
+def corpus(n: int, seed: int = 42) -> List[str]:
+    """Single compound names, and combinations of two of them."""
+    rng = random.Random(seed)
+    single_names = synthetic_names(n, seed=seed)
+    names = []
+    for name in single_names:
+        kind = rng.random()
+        if kind < 0.5:
+            names.append(name)
+        elif kind < 0.75:
+            names.append(f'{name} solution of {rng.choice(single_names)}')
+        else:
+            names.append(f'{name} / {rng.choice(single_names)}')
+    return names
+
+
+def count_filter_invocations(
+    resolve_fn: Callable[[NameSimplifier, str], Optional[List[str]]], names: List[str]
+) -> None:
+    simplifier = NameSimplifier()
+    invocations: Counter = Counter()
+    for f in simplifier.core_name_extractor.filters:
+        original_fn = f.find_matches
+
+        def counting_fn(chemical_name, _original_fn=original_fn, _name=type(f).__name__):
+            invocations[_name] += 1
+            return _original_fn(chemical_name)
+
+        f.find_matches = counting_fn  # type: ignore
+
+    results = [resolve_fn(simplifier, name) for name in names]
+    total_invocations = sum(invocations.values())
+    seconds = min(
+        timeit.repeat(lambda: [resolve_fn(simplifier, name) for name in names], number=1, repeat=3)
+    )
+
+    number_resolved = sum(result is not None for result in results)
+    print(f'{resolve_fn.__name__}:')
+    print(f'  resolved names:                        {number_resolved} / {len(names)}')
+    print(f'  filter invocations per name:           {total_invocations / len(names):.2f}')
+    print(
+        f'  filter invocations per resolved name:  {total_invocations / max(number_resolved, 1):.2f}'
+    )
+    print(f'  time per name:                         {1e6 * seconds / len(names):.1f} µs')
+
+
+number_names = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+names = corpus(number_names)
+count_filter_invocations(resolve_with_simplify, names)
+count_filter_invocations(resolve_with_resolve, names)
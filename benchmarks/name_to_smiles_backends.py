@@ -0,0 +1,108 @@
+"""
+Compares the NameToSmiles backends (dictionary, SQLite, memory-mapped file)
+for mappings of different sizes: creation time, memory / disk usage, and
+throughput for single and batch lookups (half of the looked-up names are
+present in the mapping).
+
+The sizes of the mappings are given as arguments; for the sizes of our
+synonym tables, run for instance
+    python -m benchmarks.name_to_smiles_backends 1000000 10000000 50000000
+The dictionary-based backend needs several GB of memory for 10M names and above.
+
+Usage: python -m benchmarks.name_to_smiles_backends [size ...]
+"""
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from typing import Callable, Iterator, List, Tuple
+
+from smiles2actions.dict_based_name_to_smiles import DictBasedNameToSmiles
+from smiles2actions.mmap_based_name_to_smiles import MmapBasedNameToSmiles
+from smiles2actions.name_normalizer import NameNormalizer
+from smiles2actions.name_to_smiles import NameToSmiles
+from smiles2actions.sqlite_name_to_smiles import SqliteNameToSmiles
+
+number_lookups = 20000
+batch_size = 1000
+
+
+def names_and_smiles(size: int) -> Iterator[Tuple[str, str]]:
+    for i in range(size):
+        yield f'{i:x}-methyl-{i % 97}-oxo-butanoic acid', 'C' * (1 + i % 20) + 'O'
+
+
+def query_names(size: int, seed: int = 42) -> List[str]:
+    rng = random.Random(seed)
+    present = [f'{i:x}-methyl-{i % 97}-oxo-butanoic acid' for i in rng.sample(range(size), number_lookups // 2)]
+    absent = [f'unknown compound {i}' for i in range(number_lookups // 2)]
+    names = present + absent
+    rng.shuffle(names)
+    return names
+
+
+def peak_memory_mb() -> float:
+    # ru_maxrss is in kB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def report(title: str, create_fn: Callable[[], NameToSmiles], size: int, disk_file: str = '') -> None:
+    memory_before = peak_memory_mb()
+    start = time.perf_counter()
+    name_to_smiles = create_fn()
+    creation_seconds = time.perf_counter() - start
+    memory_increase = peak_memory_mb() - memory_before
+
+    names = query_names(size)
+
+    start = time.perf_counter()
+    for name in names:
+        name_to_smiles.try_get_smiles(name)
+    single_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(0, len(names), batch_size):
+        name_to_smiles.get_smiles_many(names[i:i + batch_size])
+    batch_seconds = time.perf_counter() - start
+
+    disk_mb = os.path.getsize(disk_file) / 1e6 if disk_file else 0.0
+    print(
+        f'  {title:<8} creation {creation_seconds:8.1f} s | peak memory +{memory_increase:8.1f} MB'
+        f' | disk {disk_mb:8.1f} MB | single {len(names) / single_seconds:9.0f} names/s'
+        f' | batch {len(names) / batch_seconds:9.0f} names/s'
+    )
+
+
+sizes = [int(arg) for arg in sys.argv[1:]] or [1000000]
+normalizer = NameNormalizer.default_normalizer()
+
+for size in sizes:
+    print(f'{size} names:')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tsv_file = os.path.join(tmp_dir, 'names_to_smiles.tsv')
+        with open(tsv_file, 'wt') as f:
+            for name, smiles in names_and_smiles(size):
+                f.write(f'{name}\t{smiles}\n')
+
+        # The file-based backends go first, so that their peak memory is not hidden by the dictionary's
+        sqlite_file = os.path.join(tmp_dir, 'names_to_smiles.sqlite')
+        report(
+            'sqlite',
+            lambda: SqliteNameToSmiles.from_tsv(tsv_file, sqlite_file, normalize_fn=normalizer),
+            size, sqlite_file
+        )
+        mmap_file = os.path.join(tmp_dir, 'names_to_smiles.kv')
+        report(
+            'mmap',
+            lambda: MmapBasedNameToSmiles.from_tsv(tsv_file, mmap_file, normalize_fn=normalizer),
+            size, mmap_file
+        )
+        report(
+            'dict',
+            lambda: DictBasedNameToSmiles(
+                dict(names_and_smiles(size)), normalize_fn=normalizer
+            ),
+            size,
+        )
@@ -0,0 +1,104 @@
+"""
+Compares the parsing of reaction SMILES into ReactionEquation instances
+with the previous implementation (mutable attrs class with lists), and with
+the columnar ReactionEquationStore: time, and memory held by the parsed
+reactions (measured with tracemalloc, in a separate run).
+
+Verifies first that all the representations give the same molecules, on
+the reactions of model_training/src-*.txt.
+
+Usage: python -m benchmarks.reaction_equation_parsing [number_reactions]
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+import attr
+
+from smiles2actions.reaction_equation_store import ReactionEquationStore
+from smiles2actions.utils import ReactionEquation, detokenize_smiles, iterate_lines_from_file
+
+
+@attr.s(auto_attribs=True)
+class LegacyReactionEquation:
+    """Previous implementation of ReactionEquation."""
+    reactants: List[str]
+    agents: List[str]
+    products: List[str]
+
+    @classmethod
+    def from_string(
+        cls, reaction_string: str, fragment_bond: Optional[str] = None
+    ) -> 'LegacyReactionEquation':
+        smiles_groups = reaction_string.split('>')
+        groups = [smiles_group.split('.') for smiles_group in smiles_groups]
+        groups = [group if group != [''] else [] for group in groups]
+        if fragment_bond is not None:
+            groups = [[smi.replace(fragment_bond, '.') for smi in group] for group in groups]
+        return cls(*groups)
+
+
+number_reactions = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+src_reactions = [
+    detokenize_smiles(line)
+    for src_file in sorted((Path(__file__).resolve().parent.parent / 'model_training').glob('src-*.txt'))
+    for line in iterate_lines_from_file(src_file)
+]
+# Variations of the reactions, so that the strings are not all identical
+src_reactions += [s.replace('>>', '>O>') for s in src_reactions]
+
+store = ReactionEquationStore.from_strings(src_reactions, fragment_bond='~')
+mismatches = 0
+for i, reaction in enumerate(src_reactions):
+    legacy = LegacyReactionEquation.from_string(reaction, fragment_bond='~')
+    expected = [tuple(legacy.reactants), tuple(legacy.agents), tuple(legacy.products)]
+    new = ReactionEquation.from_string(reaction, fragment_bond='~')
+    mismatches += (
+        list(new) != expected or list(store[i]) != expected or
+        new.to_string(fragment_bond='~') != reaction
+    )
+print(f'Equivalence check on {len(src_reactions)} reactions: {mismatches} mismatches.')
+
+# Distinct strings, as in a real data set
+reactions = [f'{src_reactions[i % len(src_reactions)]}.C{i}' for i in range(number_reactions)]
+
+
+def measure(title: str, parse: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    parsed = parse()
+    seconds = time.perf_counter() - start
+    del parsed
+
+    # Separate run for the memory, since tracemalloc slows down the execution
+    tracemalloc.start()
+    parsed = parse()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+
+    print(
+        f'{title:<40} {seconds:7.2f} s | {number_reactions / seconds:9.0f} reactions/s'
+        f' | {memory / 1e6:8.1f} MB held'
+    )
+
+
+print(f'{number_reactions} reactions:')
+measure(
+    'before (from_string, lists)',
+    lambda: [LegacyReactionEquation.from_string(r, fragment_bond='~') for r in reactions]
+)
+measure(
+    'ReactionEquation.from_string',
+    lambda: [ReactionEquation.from_string(r, fragment_bond='~') for r in reactions]
+)
+measure(
+    'ReactionEquation.from_strings',
+    lambda: ReactionEquation.from_strings(reactions, fragment_bond='~')
+)
+measure(
+    'ReactionEquationStore.from_strings',
+    lambda: ReactionEquationStore.from_strings(reactions, fragment_bond='~')
+)
@@ -0,0 +1,59 @@
+"""
+Microbenchmark for ReferencedCompoundFilter.
+
+Compares the current implementation to the previous one, where the regexes
+were built as strings and matched against the full name on every call.
+Verifies that both give identical matches.
+
+Usage: python -m benchmarks.referenced_compound_filter [number_names]
+"""
+import re
+import sys
+import timeit
+from typing import List
+
+from benchmarks.name_corpus import synthetic_names
+from smiles2actions.name_filters.referenced_compound_filter import ReferencedCompoundFilter
+from smiles2actions.regex_utils import RegexMatch, capturing, match_all
+
+
+class LegacyReferencedCompoundFilter(ReferencedCompoundFilter):
+    """Previous implementation of the pattern matching."""
+
+    def _find_impl(self, name: str) -> List[RegexMatch]:
+        matches = match_all(rf' {self.one_or_two_groups}$', name)
+        if matches:
+            return matches
+        matches = match_all(rf' #?{self.one_or_two_components}$', name)
+        if matches:
+            return matches
+        matches = match_all(rf' [\(\[] ?{self.one_or_two_groups} ?[\)\]]$', name)
+        if matches:
+            return matches
+        return []
+
+    def _is_exception(self, s: str) -> bool:
+        parenthesis_regex = rf'\({capturing(".*")}\)'
+        roman_number_match = re.match(rf'^{parenthesis_regex}$', s)
+        if roman_number_match is not None:
+            content = roman_number_match.group(1)
+            if content in ['0', 'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII']:
+                return True
+        return False
+
+
+number_names = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+names = synthetic_names(number_names) + [
+    'compound 12a', 'intermediate (IV)', 'iron (III)', 'example 3-4', 'compound [ 5 b ]',
+    'amine 7 . 2', 'product #4', 'tert-butyl 1-(4-methoxy phenyl) 2 3 4 5 - XI'
+]
+
+legacy = LegacyReferencedCompoundFilter()
+current = ReferencedCompoundFilter()
+
+mismatches = [name for name in names if legacy.find_matches(name) != current.find_matches(name)]
+print(f'Equivalence check on {len(names)} names: {len(mismatches)} mismatches.')
+
+for title, f in [('before', legacy), ('after', current)]:
+    seconds = min(timeit.repeat(lambda: [f.find_matches(n) for n in names], number=1, repeat=3))
+    print(f'{title:<8} {1e6 * seconds / len(names):8.2f} µs per name')
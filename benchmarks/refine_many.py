@@ -0,0 +1,47 @@
+"""
+Measures the throughput of ActionSequenceRefiner.refine_many for different
+numbers of worker processes.
+
+Usage: python -m benchmarks.refine_many [number_sequences] [max_jobs]
+"""
+import multiprocessing
+import sys
+import time
+
+from paragraph2actions.action_string_converter import ReadableConverter
+
+from smiles2actions.action_sequence_refiner import ActionSequenceRefiner
+
+converter = ReadableConverter(separator=' ; ', end_mark='')
+
+action_strings = [
+    'ADD water (10 ml) ; STIR for 10 minutes at 25 °C ; FILTER keep filtrate ; YIELD product',
+    'ADD A ; ADD B at 0 °C ; STIR for 2 h ; ADD C at same temperature ; YIELD D',
+    'ADD A ; STIR at 50 °C ; WAIT for 10 hours ; PH with HCl to pH 3 ; YIELD D',
+    'ADD A ; ADD B ; STIR for overnight at room temperature ; CONCENTRATE ; YIELD D',
+    'ADD A ; STIR for 3 weird units ; YIELD D',
+]
+
+number_sequences = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+max_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else multiprocessing.cpu_count()
+
+
+def action_sequences():
+    for i in range(number_sequences):
+        yield converter.string_to_actions(action_strings[i % len(action_strings)])
+
+
+refiner = ActionSequenceRefiner()
+
+n_jobs = 1
+while n_jobs <= max_jobs:
+    start = time.perf_counter()
+    number_failures = sum(
+        not result.success for result in refiner.refine_many(action_sequences(), n_jobs=n_jobs)
+    )
+    seconds = time.perf_counter() - start
+    print(
+        f'n_jobs={n_jobs:<3} {number_sequences / seconds:10.0f} sequences/s '
+        f'({number_failures} failures)'
+    )
+    n_jobs *= 2
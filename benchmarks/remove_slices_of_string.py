@@ -0,0 +1,69 @@
+"""
+Microbenchmark for remove_slices_of_string.
+
+Compares the current implementation, merging the spans to remove, to the
+previous one, based on a NumPy mask. Verifies that both give identical
+results for random slices (unsorted, overlapping, out of range, negative,
+with steps).
+
+Usage: python -m benchmarks.remove_slices_of_string [number_names]
+"""
+import random
+import sys
+import timeit
+from typing import Iterable, List
+
+import numpy as np
+
+from benchmarks.name_corpus import synthetic_names
+from smiles2actions.core_name_extractor import CoreNameExtractor
+from smiles2actions.utils import remove_slices_of_string
+
+
+def legacy_remove_slices_of_string(slices: Iterable[slice], string: str) -> str:
+    """Previous implementation of remove_slices_of_string."""
+    remove_index_mask = np.full(len(string), False)
+    for s in slices:
+        remove_index_mask[s] = True
+    lst = list(string)
+    for index, remove_index in enumerate(remove_index_mask):
+        if remove_index:
+            lst[index] = ''
+    return ''.join(lst)
+
+
+def random_slices(rng: random.Random, length: int) -> List[slice]:
+    def index():
+        return rng.choice([None, rng.randint(-length - 3, length + 3)])
+
+    slices = []
+    for _ in range(rng.randint(0, 5)):
+        step = rng.choice([None, None, None, 1, 2, 3, -1, -2])
+        slices.append(slice(index(), index(), step))
+    return slices
+
+
+def check_equivalence(number_checks: int, seed: int = 42) -> int:
+    rng = random.Random(seed)
+    mismatches = 0
+    for _ in range(number_checks):
+        string = ''.join(rng.choice('abcdef ') for _ in range(rng.randint(0, 30)))
+        slices = random_slices(rng, len(string))
+        if legacy_remove_slices_of_string(slices, string) != remove_slices_of_string(slices, string):
+            mismatches += 1
+    return mismatches
+
+
+number_names = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+number_checks = 100000
+print(f'Equivalence check on {number_checks} random cases: {check_equivalence(number_checks)} mismatches.')
+
+# Realistic inputs: the names and the spans of the filter matches, as in CoreNameExtractor.strip_compound
+extractor = CoreNameExtractor()
+names = synthetic_names(number_names)
+inputs = [([m.span for f in extractor.filters for m in f.find_matches(n)], n) for n in names]
+
+for title, fn in [('before', legacy_remove_slices_of_string), ('after', remove_slices_of_string)]:
+    seconds = min(timeit.repeat(lambda: [fn(s, n) for s, n in inputs], number=1, repeat=5))
+    print(f'{title:<8} {1e6 * seconds / len(inputs):8.3f} µs per name')
@@ -0,0 +1,91 @@
+"""
+Load test for the prediction server (smiles2actions-serve).
+
+Sends requests with one reaction each from concurrent clients, and reports
+the p50 / p99 latencies and the throughput. The reactions are taken from
+model_training/src-test.txt (detokenized).
+
+Start the server first, for instance with
+    smiles2actions-serve --model model_step_500000.pt --max_batch_size 32 --max_latency_ms 50
+
+Usage: python -m benchmarks.serve_load_test [url] [number_requests] [concurrency ...]
+"""
+import json
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import List
+
+from smiles2actions.utils import detokenize_smiles, load_list_from_file
+
+url = sys.argv[1] if len(sys.argv) > 1 else 'http://127.0.0.1:8000'
+number_requests = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+concurrencies = [int(arg) for arg in sys.argv[3:]] or [1, 4, 16]
+
+src_file = Path(__file__).resolve().parent.parent / 'model_training' / 'src-test.txt'
+reactions = [detokenize_smiles(line) for line in load_list_from_file(src_file)]
+
+
+def predict(reaction: str) -> None:
+    request = urllib.request.Request(
+        f'{url}/predict',
+        data=json.dumps({'reactions': [reaction]}).encode('utf-8'),
+        headers={'Content-Type': 'application/json'}
+    )
+    with urllib.request.urlopen(request) as response:
+        response.read()
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run(concurrency: int) -> None:
+    latencies: List[float] = []
+    failures = 0
+    lock = threading.Lock()
+    next_request = iter(range(number_requests))
+
+    def client() -> None:
+        nonlocal failures
+        while True:
+            with lock:
+                i = next(next_request, None)
+            if i is None:
+                return
+            start = time.perf_counter()
+            try:
+                predict(reactions[i % len(reactions)])
+            except Exception:
+                with lock:
+                    failures += 1
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    latencies.sort()
+    if not latencies:
+        print(f'concurrency {concurrency:3d}: all {failures} requests failed')
+        return
+    print(
+        f'concurrency {concurrency:3d}: p50 {1000 * percentile(latencies, 50):8.1f} ms'
+        f' | p99 {1000 * percentile(latencies, 99):8.1f} ms'
+        f' | {len(latencies) / seconds:8.1f} reactions/s | {failures} failures'
+    )
+
+
+# Warm-up request, so that the first measurement does not include one-time initializations
+predict(reactions[0])
+for concurrency in concurrencies:
+    run(concurrency)
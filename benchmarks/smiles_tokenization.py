@@ -0,0 +1,73 @@
+"""
+Throughput of the SMILES tokenization on a file of reaction SMILES.
+
+Writes a file with the given number of reaction SMILES (the reactions of
+model_training/src-*.txt, repeated), verifies that the tokenization
+reproduces src-*.txt and round-trips with detokenize_smiles, and measures
+the throughput in tokens/s, for the lines in memory (compared to the
+previous implementation, which did not check that all the characters were
+tokenized) and for the file streamed line by line.
+
+Usage: python -m benchmarks.smiles_tokenization [number_lines]
+"""
+import os
+import re
+import sys
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+from smiles2actions.tokenization import detokenize_smiles, tokenize_smiles, tokenize_smiles_many
+from smiles2actions.utils import iterate_lines_from_file
+
+# Previous implementation, in dataset_builder
+_legacy_regex = re.compile(
+    r'(\[[^\]]+]|Br?|Cl?|N|O|S|P|F|I|b|c|n|o|s|p|\(|\)|\.|=|#|-|\+|\\|/|:|~|@|\?|>>|>|\*|\$|%[0-9]{2}|[0-9])'
+)
+
+
+def legacy_tokenize_smiles(smiles: str) -> str:
+    return ' '.join(_legacy_regex.findall(smiles))
+
+
+number_lines = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+src_lines = [
+    line for src_file in sorted((Path(__file__).resolve().parent.parent / 'model_training').glob('src-*.txt'))
+    for line in iterate_lines_from_file(src_file)
+]
+mismatches = sum(
+    tokenize_smiles(detokenize_smiles(line)) != line or
+    detokenize_smiles(tokenize_smiles(detokenize_smiles(line))) != detokenize_smiles(line)
+    for line in src_lines
+)
+print(f'Round-trip check on {len(src_lines)} lines of src-*.txt: {mismatches} mismatches.')
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    smiles_file = os.path.join(tmp_dir, 'reactions.smi')
+    with open(smiles_file, 'wt') as f:
+        for i in range(number_lines):
+            f.write(detokenize_smiles(src_lines[i % len(src_lines)]) + '\n')
+
+    number_tokens = sum(
+        line.count(' ') + 1 for line in
+        (src_lines[i % len(src_lines)] for i in range(number_lines))
+    )
+
+    lines = list(iterate_lines_from_file(smiles_file))
+    for title, tokenize_all in [
+        ('before', lambda: [legacy_tokenize_smiles(line) for line in lines]),
+        ('tokenization', lambda: list(tokenize_smiles_many(lines))),
+    ]:
+        seconds = min(timeit.repeat(tokenize_all, number=1, repeat=3))
+        print(f'{title:<14} in memory: {number_tokens / seconds / 1e6:6.2f} M tokens/s')
+
+    start = time.perf_counter()
+    for _ in tokenize_smiles_many(iterate_lines_from_file(smiles_file)):
+        pass
+    seconds = time.perf_counter() - start
+    print(
+        f'tokenization   streamed from the file (including the reading): '
+        f'{number_tokens / seconds / 1e6:6.2f} M tokens/s, {number_lines / seconds:9.0f} lines/s'
+    )
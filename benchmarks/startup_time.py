@@ -0,0 +1,57 @@
+"""
+Measures the time needed to import ActionSequenceRefiner in a fresh process.
+
+Every measurement is done in a separate subprocess, so that nothing is cached
+in memory. The import is timed without the disk cache for the unit registry,
+and with it (see the environment variable SMILES2ACTIONS_UNIT_REGISTRY_CACHE).
+For reference, the time for building one pint.UnitRegistry is also given; before
+the registry was shared, importing ActionSequenceRefiner built six of them.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from typing import Dict, List, Optional
+
+import pint
+
+from smiles2actions.quantities.quantities_utils import UNIT_REGISTRY_CACHE_ENV_VARIABLE
+
+number_runs = 5
+
+import_statement = (
+    'import time; t = time.perf_counter(); '
+    'from smiles2actions.action_sequence_refiner import ActionSequenceRefiner; '
+    'print(time.perf_counter() - t)'
+)
+
+
+def time_import(cache_file: Optional[str]) -> List[float]:
+    env: Dict[str, str] = dict(os.environ)
+    env.pop(UNIT_REGISTRY_CACHE_ENV_VARIABLE, None)
+    if cache_file is not None:
+        env[UNIT_REGISTRY_CACHE_ENV_VARIABLE] = cache_file
+
+    timings = []
+    for _ in range(number_runs):
+        output = subprocess.check_output([sys.executable, '-c', import_statement], env=env)
+        timings.append(float(output))
+    return timings
+
+
+def report(title: str, timings: List[float]) -> None:
+    print(f'{title:<40} median {statistics.median(timings):.3f} s, min {min(timings):.3f} s')
+
+
+registry_build_time = min(timeit.repeat(pint.UnitRegistry, number=1, repeat=number_runs))
+print(f'{"Build of one pint.UnitRegistry":<40} min {registry_build_time:.3f} s')
+
+report('Import without registry disk cache', time_import(cache_file=None))
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    cache_file = os.path.join(tmp_dir, 'unit_registry.pkl')
+    # first import creates the cache file
+    time_import(cache_file=cache_file)
+    report('Import with registry disk cache', time_import(cache_file=cache_file))
@@ -0,0 +1,369 @@
+"""
+Benchmark suite for the name processing, the quantity parsing and the
+action refinement, with stored baselines.
+
+Groups:
+    names:      NameSimplifier.simplify on a Zipf-distributed name corpus
+                (with and without cache).
+    filters:    each class of smiles2actions.name_filters in isolation.
+    actions:    get_vue, TemperaturePlaceholder / DurationPlaceholder,
+                ActionSequenceRefiner.refine and ActionSequenceValidator.validate,
+                on action sequences built from model_training/tgt-*.txt.
+
+For every benchmark, after an untimed warm-up run, the throughput (items/s,
+best of several repeats) and the peak memory allocated during one run
+(measured with tracemalloc, in a separate run) are reported. The quantity
+parsing cache is cleared before every run, and the objects with caches of
+their own (f.i. ActionSequenceRefiner) are created again, so that the
+timings do not depend on the previous benchmarks.
+
+The results can be stored as a baseline (benchmarks/baseline.json by
+default) with --save-baseline; later runs are compared to it, and the
+benchmarks that are slower than the baseline by more than the tolerance
+are marked as regressions (with --check, the exit code is then 1).
+The baselines depend on the machine: compare runs on the same hardware.
+
+Usage: python -m benchmarks.suite [--group GROUP ...] [--scale SCALE] [--repeat N]
+                                  [--baseline FILE] [--save-baseline] [--check]
+"""
+import argparse
+import json
+import platform
+import random
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import attr
+from paragraph2actions.action_string_converter import ReadableConverter
+
+from benchmarks.name_corpus import synthetic_names
+from smiles2actions.action_sequence_refiner import ActionSequenceRefiner
+from smiles2actions.action_sequence_validator import ActionSequenceValidator, InvalidActionSequence
+from smiles2actions.name_filters.compound_name_trimmer import CompoundNameTrimmer
+from smiles2actions.name_filters.concentration_filter import ConcentrationFilter
+from smiles2actions.name_filters.diverse_filter import DiverseFilter
+from smiles2actions.name_filters.material_descriptor_filter import MaterialDescriptorFilter
+from smiles2actions.name_filters.matter_word_filter import MatterWordFilter
+from smiles2actions.name_filters.mixture_composition_filter import MixtureCompositionFilter
+from smiles2actions.name_filters.multiple_compound_detector import MultipleCompoundDetector
+from smiles2actions.name_filters.referenced_compound_filter import ReferencedCompoundFilter
+from smiles2actions.name_filters.solution_descriptor_filter import SolutionDescriptorFilter
+from smiles2actions.name_filters.state_filter import StateFilter
+from smiles2actions.name_filters.temperature_adjective_filter import TemperatureAdjectiveFilter
+from smiles2actions.name_simplifier import NameSimplifier
+from smiles2actions.quantities.duration_placeholder import DurationPlaceholder
+from smiles2actions.quantities.temperature_placeholder import TemperaturePlaceholder
+from smiles2actions.quantities.value_unit_entity import VUEParseError, get_parsing_cache, get_vue
+
+root_directory = Path(__file__).resolve().parent.parent
+default_baseline_file = Path(__file__).resolve().parent / 'baseline.json'
+
+converter = ReadableConverter(separator=' ; ', end_mark='')
+
+temperatures = [
+    'room temperature', 'rt', 'RT', '0 °C', '0°C', '-78 °C', '25 °C', '50 °C', '60°C', '80 °C',
+    '100 °C', '0-5 °C', '-10 °C', '20-25 °C', '40 °C', '120 °C', '70° C', '5 °C', '273 K',
+    '212 °F', '-5 °C', '150 °C', '-20 °C', '35 °C', '90-95 °C', '30 °C'
+]
+durations = [
+    'overnight', '1 h', '2 h', '30 min', '1.5 hours', '3 days', '10 minutes', '16 h', '45 min',
+    '2 hours', '5 min', '24 h', '1 hour', '20 to 30 mins', '4 hr', '90 seconds', '12h', '3.5 h',
+    '15 minutes', '48 hours', '1 day', '2.5 h', '6 h', '40 min', '8 hr', '72 h'
+]
+
+Operation = Callable[[], Any]
+
+
+@attr.s(auto_attribs=True)
+class Benchmark:
+    """
+    Benchmark of one operation.
+
+    The preparation is called before every run and is not timed; it returns
+    the operation to time and the number of items the operation processes.
+    """
+    group: str
+    name: str
+    prepare: Callable[[], Tuple[Operation, int]]
+
+
+@attr.s(auto_attribs=True)
+class BenchmarkResult:
+    items_per_second: float
+    peak_memory_kib: float
+
+
+def zipf_sample(vocabulary: List[str], n: int, exponent: float = 1.1, seed: int = 42) -> List[str]:
+    """Sample from a vocabulary, with the frequency of the k-th element proportional to 1 / k^exponent."""
+    rng = random.Random(seed)
+    weights = [1 / rank**exponent for rank in range(1, len(vocabulary) + 1)]
+    return rng.choices(vocabulary, weights=weights, k=n)
+
+
+def convert_all(
+    fn: Callable[[str], Any], texts: List[str], exception_type: Type[Exception]
+) -> None:
+    """Apply a conversion to all the texts, ignoring the ones that cannot be converted."""
+    for text in texts:
+        try:
+            fn(text)
+        except exception_type:
+            pass
+
+
+def tgt_action_strings(n: int, seed: int = 42) -> List[str]:
+    """
+    Action strings from model_training/tgt-*.txt, where the temperature and
+    duration placeholders are replaced by actual temperatures and durations.
+    """
+    rng = random.Random(seed)
+    lines = [
+        line.strip() for tgt_file in sorted((root_directory / 'model_training').glob('tgt-*.txt'))
+        for line in tgt_file.read_text().splitlines() if line.strip()
+    ]
+
+    def to_raw_string(line: str) -> str:
+        line = re.sub(r'#-?\d+#', lambda _: rng.choice(temperatures), line)
+        return re.sub(r'@-?\d+@', lambda _: rng.choice(durations), line)
+
+    return [to_raw_string(lines[i % len(lines)]) for i in range(n)]
+
+
+def name_benchmarks(scale: float) -> List[Benchmark]:
+    names = zipf_sample(synthetic_names(5000, seed=1), int(20000 * scale))
+
+    def simplify(cache_size: int) -> Callable[[], Tuple[Operation, int]]:
+
+        def prepare() -> Tuple[Operation, int]:
+            simplifier = NameSimplifier(cache_size=cache_size)
+            return lambda: [list(simplifier.simplify(name)) for name in names], len(names)
+
+        return prepare
+
+    return [
+        Benchmark('names', 'NameSimplifier.simplify', simplify(0)),
+        Benchmark('names', 'NameSimplifier.simplify (cache 10000)', simplify(10000)),
+    ]
+
+
+def filter_benchmarks(scale: float) -> List[Benchmark]:
+    names = synthetic_names(int(20000 * scale))
+    filters = [
+        TemperatureAdjectiveFilter(),
+        ConcentrationFilter(),
+        SolutionDescriptorFilter(),
+        MaterialDescriptorFilter(),
+        MatterWordFilter(),
+        StateFilter(),
+        MixtureCompositionFilter(),
+        ReferencedCompoundFilter(),
+        DiverseFilter(),
+    ]
+    operations: List[Tuple[str, Callable[[str], Any]]] = [
+        (f'{type(f).__name__}.find_matches', f.find_matches) for f in filters
+    ]
+    operations.append(('CompoundNameTrimmer.trim', CompoundNameTrimmer().trim))
+    operations.append(
+        ('MultipleCompoundDetector.get_candidates', MultipleCompoundDetector().get_candidates)
+    )
+
+    def prepare_fn(fn: Callable[[str], Any]) -> Callable[[], Tuple[Operation, int]]:
+        return lambda: (lambda: [fn(name) for name in names], len(names))
+
+    return [Benchmark('filters', title, prepare_fn(fn)) for title, fn in operations]
+
+
+def action_benchmarks(scale: float) -> List[Benchmark]:
+    quantity_strings = zipf_sample(temperatures + durations, int(5000 * scale))
+    temperature_strings = zipf_sample(temperatures, int(5000 * scale))
+    duration_strings = zipf_sample(durations, int(5000 * scale))
+    action_strings = tgt_action_strings(int(2000 * scale))
+
+    temperature_placeholder = TemperaturePlaceholder()
+    duration_placeholder = DurationPlaceholder()
+    validator = ActionSequenceValidator()
+
+    def prepare_refine() -> Tuple[Operation, int]:
+        # New refiner for every run, so that the caches of its placeholder resolvers are empty
+        refiner = ActionSequenceRefiner()
+        # refine() modifies the actions in place; they are parsed again for every run
+        action_sequences = [converter.string_to_actions(s) for s in action_strings]
+        return lambda: [refiner.refine(actions) for actions in action_sequences], len(action_sequences)
+
+    def prepare_validate() -> Tuple[Operation, int]:
+        refiner = ActionSequenceRefiner()
+        refined_sequences = [refiner.refine(converter.string_to_actions(s)) for s in action_strings]
+
+        def validate_all() -> None:
+            for actions in refined_sequences:
+                try:
+                    validator.validate(actions)
+                except InvalidActionSequence:
+                    pass
+
+        return validate_all, len(refined_sequences)
+
+    return [
+        Benchmark(
+            'actions', 'get_vue', lambda:
+            (lambda: convert_all(get_vue, quantity_strings, VUEParseError), len(quantity_strings))
+        ),
+        Benchmark(
+            'actions', 'TemperaturePlaceholder.to_placeholder', lambda: (
+                lambda: convert_all(
+                    temperature_placeholder.to_placeholder, temperature_strings, ValueError
+                ), len(temperature_strings)
+            )
+        ),
+        Benchmark(
+            'actions', 'DurationPlaceholder.to_placeholder', lambda: (
+                lambda: convert_all(duration_placeholder.to_placeholder, duration_strings, ValueError),
+                len(duration_strings)
+            )
+        ),
+        Benchmark('actions', 'ActionSequenceRefiner.refine', prepare_refine),
+        Benchmark('actions', 'ActionSequenceValidator.validate', prepare_validate),
+    ]
+
+
+benchmark_groups: Dict[str, Callable[[float], List[Benchmark]]] = {
+    'names': name_benchmarks,
+    'filters': filter_benchmarks,
+    'actions': action_benchmarks,
+}
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int) -> BenchmarkResult:
+    # Untimed run first, for the one-time initializations (f.i. quantulum's classifier)
+    operation, _ = benchmark.prepare()
+    operation()
+
+    best_seconds = float('inf')
+    number_items = 0
+    for _ in range(repeat):
+        operation, number_items = benchmark.prepare()
+        get_parsing_cache().clear()
+        start = time.perf_counter()
+        operation()
+        best_seconds = min(best_seconds, time.perf_counter() - start)
+
+    # Separate run for the memory, since tracemalloc slows down the execution
+    operation, _ = benchmark.prepare()
+    get_parsing_cache().clear()
+    tracemalloc.start()
+    operation()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return BenchmarkResult(
+        items_per_second=number_items / best_seconds, peak_memory_kib=peak_bytes / 1024
+    )
+
+
+def load_baseline(baseline_file: Path) -> Dict[str, BenchmarkResult]:
+    if not baseline_file.exists():
+        return {}
+    with open(str(baseline_file), 'rt') as f:
+        content = json.load(f)
+    return {key: BenchmarkResult(**value) for key, value in content['results'].items()}
+
+
+def save_baseline(
+    baseline_file: Path, results: Dict[str, BenchmarkResult], scale: float, repeat: int
+) -> None:
+    # Keep the stored results of the groups that were not run
+    all_results = load_baseline(baseline_file)
+    all_results.update(results)
+    content = {
+        'environment':
+            {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'processor': platform.processor() or platform.machine(),
+                'scale': scale,
+                'repeat': repeat,
+            },
+        'results':
+            {
+                key: {
+                    'items_per_second': round(value.items_per_second, 1),
+                    'peak_memory_kib': round(value.peak_memory_kib, 1)
+                }
+                for key, value in sorted(all_results.items())
+            },
+    }
+    with open(str(baseline_file), 'wt') as f:
+        json.dump(content, f, indent=2)
+        f.write('\n')
+
+
+def comparison(result: BenchmarkResult, baseline: Optional[BenchmarkResult],
+               tolerance: float) -> Tuple[str, bool]:
+    """Returns the text for the comparison to the baseline, and whether it is a regression."""
+    if baseline is None:
+        return '', False
+    ratio = result.items_per_second / baseline.items_per_second
+    is_regression = ratio < 1 - tolerance
+    text = f'{ratio:6.2f}x baseline'
+    if is_regression:
+        text += '  REGRESSION'
+    return text, is_regression
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument(
+        '--group', choices=list(benchmark_groups), action='append', help='Groups to run (default: all)'
+    )
+    parser.add_argument(
+        '--scale', type=float, default=1.0, help='Factor for the number of items per benchmark'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Number of timed runs per benchmark')
+    parser.add_argument('--baseline', type=Path, default=default_baseline_file, help='Baseline file')
+    parser.add_argument(
+        '--save-baseline', action='store_true', help='Store the results in the baseline file'
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.2,
+        help='Relative decrease in throughput considered as a regression'
+    )
+    parser.add_argument(
+        '--check', action='store_true', help='Exit with code 1 if there is a regression'
+    )
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    results: Dict[str, BenchmarkResult] = {}
+    regressions: List[str] = []
+    for group in args.group or list(benchmark_groups):
+        print(f'[{group}]')
+        for benchmark in benchmark_groups[group](args.scale):
+            key = f'{benchmark.group}/{benchmark.name}'
+            result = run_benchmark(benchmark, args.repeat)
+            results[key] = result
+            text, is_regression = comparison(result, baseline.get(key), args.tolerance)
+            if is_regression:
+                regressions.append(key)
+            print(
+                f'  {benchmark.name:<45} {result.items_per_second:12.0f} items/s'
+                f' | peak {result.peak_memory_kib:10.1f} KiB | {text}'
+            )
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results, args.scale, args.repeat)
+        print(f'Baseline saved to {args.baseline}.')
+
+    if regressions:
+        print(f'{len(regressions)} regression(s): {", ".join(regressions)}')
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
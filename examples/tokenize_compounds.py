@@ -54,8 +54,8 @@ compound_placeholder_handler = PlaceholderHandler.for_compounds()
 def tokenize_compounds(actions: Iterable[Action]) -> None:
     """Tokenize the compound names of a list of actions, in-place."""
     for chemical in extract_chemicals(actions):
-        if n2s.has_smiles(chemical.name):
-            smiles = n2s.get_smiles(chemical.name)
+        smiles = n2s.try_get_smiles(chemical.name)
+        if smiles is not None:
             try:
                 position = molecule_position.get_position_for_smiles(smiles)
                 chemical.name = compound_placeholder_handler.to_placeholder(position)
@@ -43,4 +43,11 @@ setup(
         'textdistance>=4.1.5',
         'paragraph2actions @ git+https://github.com/rxn4chemistry/paragraph2actions',
     ],
+    entry_points={
+        'console_scripts': [
+            'smiles2actions-build-dataset=smiles2actions.scripts.build_dataset:main',
+            'smiles2actions-build-placeholder-table=smiles2actions.scripts.build_placeholder_table:main',
+            'smiles2actions-serve=smiles2actions.scripts.serve:main',
+        ],
+    },
 )
@@ -0,0 +1,68 @@
+import re
+from typing import Dict, List, Match, Optional
+
+from .molecule_position import MoleculePosition
+from .quantities.duration_placeholder import default_intervals as default_duration_intervals
+from .quantities.quantity_binning_limits import BinningInterval
+from .quantities.temperature_placeholder import \
+    default_intervals as default_temperature_intervals
+from .utils import ReactionEquation
+
+
+class ActionDetokenizer:
+    """
+    Replaces the placeholders in action strings predicted by the model:
+    * $k$ by the SMILES of the molecule at position k in the reaction
+      (negative positions for the products),
+    * #k# by the temperature representing the k-th temperature bin,
+    * @k@ by the duration representing the k-th duration bin.
+
+    Placeholders without corresponding molecule or bin are left unchanged.
+    """
+
+    _placeholder_regex = re.compile(r'([$#@])(-?\d+)\1')
+
+    def __init__(
+        self,
+        temperature_intervals: Optional[List[BinningInterval]] = None,
+        duration_intervals: Optional[List[BinningInterval]] = None,
+    ):
+        """
+        Args:
+            temperature_intervals: intervals for the temperature binning.
+                Defaults to the ones of TemperaturePlaceholder.
+            duration_intervals: intervals for the duration binning.
+                Defaults to the ones of DurationPlaceholder.
+        """
+        if temperature_intervals is None:
+            temperature_intervals = default_temperature_intervals
+        if duration_intervals is None:
+            duration_intervals = default_duration_intervals
+
+        self.quantity_strings: Dict[str, Dict[int, str]] = {
+            '#': self._substitute_strings(temperature_intervals),
+            '@': self._substitute_strings(duration_intervals),
+        }
+
+    def detokenize(self, action_string: str, reaction_equation: ReactionEquation) -> str:
+        """
+        Args:
+            action_string: action string with placeholders, as predicted by the model.
+            reaction_equation: reaction the actions were predicted for.
+        """
+        molecule_position = MoleculePosition(reaction_equation)
+
+        def replace(match: Match) -> str:
+            kind, index = match.group(1), int(match.group(2))
+            if kind == '$':
+                replacement = molecule_position.inverse_position_dict.get(index)
+            else:
+                replacement = self.quantity_strings[kind].get(index)
+            return match.group(0) if replacement is None else replacement
+
+        return self._placeholder_regex.sub(replace, action_string)
+
+    @staticmethod
+    def _substitute_strings(intervals: List[BinningInterval]) -> Dict[int, str]:
+        # The placeholder indices start at 1, see TemperaturePlaceholder and DurationPlaceholder
+        return {index: f'{interval.substitute:~P}' for index, interval in enumerate(intervals, 1)}
@@ -0,0 +1,99 @@
+from typing import List, Optional
+
+import attr
+
+from .action_detokenizer import ActionDetokenizer
+from .onmt_translator import OnmtTranslator
+from .tokenization import tokenize_smiles
+from .utils import InvalidReactionSmiles, ReactionEquation
+
+
+@attr.s(auto_attribs=True)
+class PredictedActions:
+    """
+    Action string predicted for a reaction.
+
+    Attributes:
+        raw: action string as predicted by the model, with placeholders
+            for the compounds ($k$), temperatures (#k#) and durations (@k@).
+        actions: action string where the placeholders are replaced by
+            the SMILES and the representative temperatures and durations.
+        score: log-likelihood of the prediction.
+    """
+    raw: str
+    actions: str
+    score: float
+
+
+@attr.s(auto_attribs=True)
+class ActionPrediction:
+    """Predictions for one reaction, from the most to the least likely."""
+    reaction_smiles: str
+    candidates: List[PredictedActions]
+
+
+class ActionPredictor:
+    """
+    Predicts the actions for reaction SMILES with the trained translation model.
+    """
+
+    def __init__(
+        self,
+        translator: OnmtTranslator,
+        fragment_bond: str = '~',
+        detokenizer: Optional[ActionDetokenizer] = None
+    ):
+        """
+        Args:
+            translator: translation model from tokenized reaction SMILES to action strings.
+            fragment_bond: fragment bond in the reaction SMILES.
+            detokenizer: replaces the placeholders in the predictions. Defaults to the default ActionDetokenizer.
+        """
+        self.translator = translator
+        self.fragment_bond = fragment_bond
+        self.detokenizer = ActionDetokenizer() if detokenizer is None else detokenizer
+
+    def reaction_equation(self, reaction_smiles: str) -> ReactionEquation:
+        """
+        Raises:
+            InvalidReactionSmiles if the string is not a reaction SMILES.
+        """
+        return ReactionEquation.from_string(reaction_smiles, fragment_bond=self.fragment_bond)
+
+    def check_reaction_smiles(self, reaction_smiles: str) -> None:
+        """
+        Raises:
+            InvalidReactionSmiles if the string is not a reaction SMILES.
+            SmilesTokenizationError if the string cannot be tokenized.
+        """
+        self.reaction_equation(reaction_smiles)
+        tokenize_smiles(reaction_smiles)
+
+    def predict(self, reaction_smiles: str) -> ActionPrediction:
+        return self.predict_many([reaction_smiles])[0]
+
+    def predict_many(self, reaction_smiles_list: List[str]) -> List[ActionPrediction]:
+        """
+        Predict the actions for several reactions, translated in one batch.
+
+        Raises:
+            InvalidReactionSmiles if one of the strings is not a reaction SMILES.
+            SmilesTokenizationError if one of the strings cannot be tokenized.
+        """
+        reaction_equations = [self.reaction_equation(smiles) for smiles in reaction_smiles_list]
+        translations = self.translator.translate(
+            [tokenize_smiles(smiles) for smiles in reaction_smiles_list]
+        )
+        return [
+            ActionPrediction(
+                reaction_smiles=smiles,
+                candidates=[
+                    PredictedActions(
+                        raw=candidate.text,
+                        actions=self.detokenizer.detokenize(candidate.text, reaction_equation),
+                        score=candidate.score
+                    ) for candidate in candidates
+                ]
+            ) for smiles, reaction_equation, candidates in
+            zip(reaction_smiles_list, reaction_equations, translations)
+        ]
@@ -1,5 +1,7 @@
-from typing import List, Optional
+import multiprocessing
+from typing import Iterable, Iterator, List, Optional
 
+import attr
 from paragraph2actions.actions import Action, PH, Extract, Wash, Degas
 from paragraph2actions.postprocessing.filter_postprocessor import FilterPostprocessor
 from paragraph2actions.postprocessing.initial_makesolution_postprocessor import \
@@ -14,12 +16,30 @@ from paragraph2actions.utils import (
     remove_quantities
 )
 
+from . import profiling
 from .quantities.duration_placeholder import DurationPlaceholder
 from .quantities.ph_binner import PHBinner
+from .quantities.placeholder_resolver import PlaceholderResolver
 from .quantities.quantity_binner import BinningError
 from .quantities.temperature_placeholder import TemperaturePlaceholder
 
 
+@attr.s(auto_attribs=True)
+class RefinementResult:
+    """
+    Result of the refinement of one action sequence by ActionSequenceRefiner.refine_many.
+
+    Exactly one of "actions" and "error_type" is set.
+    """
+    actions: Optional[List[Action]] = None
+    error_type: Optional[str] = None
+    error_message: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error_type is None
+
+
 class ActionSequenceRefiner:
     """
     Refines sequences of actions for use as training data for SMILES to actions.
@@ -46,20 +66,76 @@ class ActionSequenceRefiner:
         )
         self.duration_placeholders = DurationPlaceholder()
         self.temperature_placeholders = TemperaturePlaceholder()
+        # Precomputed tables can be loaded into the resolvers, see PlaceholderResolver.load
+        self.duration_resolver = PlaceholderResolver(self.duration_placeholders.to_placeholder)
+        self.temperature_resolver = PlaceholderResolver(
+            self.temperature_placeholders.to_placeholder
+        )
         self.ph_binner = PHBinner()
         self.ph_bin_names = ['acidic', 'neutral', 'basic']
 
     def refine(self, actions: List[Action]) -> List[Action]:
-        actions = self.general_action_postprocessing(actions)
+        with profiling.stage('refiner.general_postprocessing'):
+            actions = self.general_action_postprocessing(actions)
         self.replace_unknown_durations(actions)
-        self.bin_ph(actions)
-        self.bin_durations(actions)
-        self.bin_temperatures(actions)
+        with profiling.stage('refiner.ph_binning'):
+            self.bin_ph(actions)
+        with profiling.stage('refiner.duration_binning'):
+            self.bin_durations(actions)
+        with profiling.stage('refiner.temperature_binning'):
+            self.bin_temperatures(actions)
         self.remove_repetitions_for_wash_and_extract(actions)
         self.maybe_remove_atmosphere(actions)
-        remove_quantities(actions)
+        with profiling.stage('refiner.remove_quantities'):
+            remove_quantities(actions)
         return actions
 
+    def refine_many(
+        self,
+        action_sequences: Iterable[List[Action]],
+        n_jobs: Optional[int] = None,
+        chunksize: int = 64
+    ) -> Iterator[RefinementResult]:
+        """
+        Refine many action sequences, potentially in parallel.
+
+        The action sequences are streamed through the worker processes, and the
+        results are given in the same order as the input. The failures for
+        individual sequences (such as BinningError) are given as results
+        instead of being raised.
+
+        The worker processes use copies of this refiner (pickled once per
+        worker), so that the results do not depend on n_jobs; this includes
+        the tables loaded into the placeholder resolvers.
+
+        Args:
+            action_sequences: action sequences to refine.
+            n_jobs: number of worker processes. Defaults to the number of CPUs.
+                With 1, the refinement happens in the current process.
+            chunksize: number of sequences sent to a worker at once.
+
+        Returns:
+            Iterator over the refinement results.
+        """
+        if n_jobs is None:
+            n_jobs = multiprocessing.cpu_count()
+
+        if n_jobs == 1:
+            for actions in action_sequences:
+                yield self._refine_to_result(actions)
+            return
+
+        with multiprocessing.Pool(
+            n_jobs, initializer=_initialize_worker, initargs=(self, )
+        ) as pool:
+            yield from pool.imap(_refine_in_worker, action_sequences, chunksize=chunksize)
+
+    def _refine_to_result(self, actions: List[Action]) -> RefinementResult:
+        try:
+            return RefinementResult(actions=self.refine(actions))
+        except ValueError as e:
+            return RefinementResult(error_type=e.__class__.__name__, error_message=str(e))
+
     def general_action_postprocessing(self, actions: List[Action]) -> List[Action]:
         return self.processor.postprocess(actions)
 
@@ -75,10 +151,10 @@ class ActionSequenceRefiner:
                     continue
 
     def bin_durations(self, actions: List[Action]) -> None:
-        apply_to_durations(actions, self.duration_placeholders.to_placeholder)
+        apply_to_durations(actions, self.duration_resolver.to_placeholder)
 
     def bin_temperatures(self, actions: List[Action]) -> None:
-        apply_to_temperatures(actions, self.temperature_placeholders.to_placeholder)
+        apply_to_temperatures(actions, self.temperature_resolver.to_placeholder)
 
     def replace_unknown_durations(self, actions: List[Action]) -> None:
         """For some action types, replace unknown durations by None."""
@@ -103,3 +179,18 @@ class ActionSequenceRefiner:
             return None
 
         apply_to_atmospheres(actions, fn)
+
+
+# Refiner of the current worker process for ActionSequenceRefiner.refine_many,
+# copied from the refiner of refine_many by _initialize_worker.
+_worker_refiner: Optional[ActionSequenceRefiner] = None
+
+
+def _initialize_worker(refiner: ActionSequenceRefiner) -> None:
+    global _worker_refiner
+    _worker_refiner = refiner
+
+
+def _refine_in_worker(actions: List[Action]) -> RefinementResult:
+    assert _worker_refiner is not None
+    return _worker_refiner._refine_to_result(actions)
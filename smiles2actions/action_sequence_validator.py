@@ -7,6 +7,8 @@ from paragraph2actions.actions import (
 )
 from paragraph2actions.utils import extract_chemicals
 
+from . import profiling
+
 
 class InvalidActionSequence(ValueError):
 
@@ -54,6 +56,7 @@ class ActionSequenceValidator:
         )
         self.short_sequence_threshold = 5
 
+    @profiling.profiled('validator.validate')
     def validate(self, actions: List[Action]) -> None:
         """
         Raises InvalidActionSequence or subclass if the action sequence is not
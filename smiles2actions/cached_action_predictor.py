@@ -0,0 +1,215 @@
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Match, Optional, Union
+
+import attr
+
+from .action_predictor import ActionPrediction, PredictedActions
+from .lru_cache import CacheStatistics, LRUCache
+from .sqlite_mapping import SqliteMapping
+from .utils import ReactionEquation
+
+_compound_placeholder_regex = re.compile(r'\$(-?\d+)\$')
+
+
+@attr.s(auto_attribs=True)
+class CanonicalReaction:
+    """
+    Canonical form of a reaction, with its reactants, agents and products
+    sorted, and the positions of its molecules in the original reaction.
+
+    Attributes:
+        reaction_smiles: canonical reaction SMILES.
+        original_positions: for each position in the canonical reaction, as
+            used in the compound placeholders ($1$, $2$, ..., $-1$ for the
+            first product), the position in the original reaction.
+    """
+    reaction_smiles: str
+    original_positions: Dict[int, int]
+
+
+def canonicalize_reaction(reaction_smiles: str, fragment_bond: str = '~') -> CanonicalReaction:
+    """
+    Get the canonical form of a reaction SMILES, identical for the reactions
+    that differ only by the order of their reactants, agents, or products.
+
+    Raises:
+        InvalidReactionSmiles if the string is not a reaction SMILES.
+    """
+    reaction_equation = ReactionEquation.from_string(reaction_smiles, fragment_bond=fragment_bond)
+
+    # Positions start at 1 for the reactants and agents (in this order), and at -1 for the products
+    precursors = [(0, i, smiles) for i, smiles in enumerate(reaction_equation.reactants)]
+    precursors += [
+        (1, i + len(reaction_equation.reactants), smiles)
+        for i, smiles in enumerate(reaction_equation.agents)
+    ]
+    products = [(0, i, smiles) for i, smiles in enumerate(reaction_equation.products)]
+
+    # Sorted per group, then per SMILES; identical SMILES keep their relative order
+    sorted_precursors = sorted(precursors, key=lambda p: (p[0], p[2]))
+    sorted_products = sorted(products, key=lambda p: p[2])
+
+    original_positions: Dict[int, int] = {}
+    for position, (_, original_index, _) in enumerate(sorted_precursors, 1):
+        original_positions[position] = original_index + 1
+    for position, (_, original_index, _) in enumerate(sorted_products, 1):
+        original_positions[-position] = -(original_index + 1)
+
+    canonical_equation = ReactionEquation(
+        reactants=[smiles for group, _, smiles in sorted_precursors if group == 0],
+        agents=[smiles for group, _, smiles in sorted_precursors if group == 1],
+        products=[smiles for _, _, smiles in sorted_products],
+    )
+    return CanonicalReaction(
+        reaction_smiles=canonical_equation.to_string(fragment_bond=fragment_bond),
+        original_positions=original_positions
+    )
+
+
+def remap_compound_placeholders(action_string: str, positions: Dict[int, int]) -> str:
+    """
+    Replace the compound placeholders ($k$) according to a mapping between
+    positions; the placeholders not in the mapping are left unchanged.
+    """
+
+    def replace(match: Match) -> str:
+        position = positions.get(int(match.group(1)))
+        return match.group(0) if position is None else f'${position}$'
+
+    return _compound_placeholder_regex.sub(replace, action_string)
+
+
+class CachedActionPredictor:
+    """
+    Caching front end for the action prediction.
+
+    The predictions are cached for the canonical form of the reactions (see
+    canonicalize_reaction), so that a reaction queried again, even with its
+    molecules in a different order, does not need another translation. The
+    reactions not in the cache are predicted in their canonical form; the
+    compound placeholders in the raw predictions are then remapped to the
+    order of the molecules given by the caller.
+
+    The predictions are kept in an LRU cache in memory and, optionally, in an
+    SQLite file that persists between runs. This file must only be used with
+    one model and one set of translation settings.
+
+    The instances can be used from several threads.
+    """
+
+    def __init__(
+        self,
+        predict_many: Callable[[List[str]], List[ActionPrediction]],
+        fragment_bond: str = '~',
+        cache_size: int = 100000,
+        cache_file: Optional[Union[Path, str]] = None,
+    ):
+        """
+        Args:
+            predict_many: function predicting the actions for several reaction
+                SMILES, f.i. ActionPredictor.predict_many.
+            fragment_bond: fragment bond in the reaction SMILES.
+            cache_size: number of predictions to keep in memory. With 0, nothing is cached in memory.
+            cache_file: SQLite file for the on-disk cache; created if it does not exist.
+        """
+        self.predict_many_fn = predict_many
+        self.fragment_bond = fragment_bond
+
+        self._memory_cache: LRUCache[str, List[PredictedActions]] = LRUCache(maxsize=cache_size)
+        self._memory_cache_lock = threading.Lock()
+        self._disk_cache: Optional[SqliteMapping] = None
+        if cache_file is not None:
+            # Shared connection: the callers may be short-lived threads (f.i. one per server request)
+            self._disk_cache = SqliteMapping(
+                cache_file, table='action_predictions', shared_connection=True
+            )
+
+    def predict(self, reaction_smiles: str) -> ActionPrediction:
+        return self.predict_many([reaction_smiles])[0]
+
+    def predict_many(self, reaction_smiles_list: List[str]) -> List[ActionPrediction]:
+        """
+        Predict the actions for several reactions; the ones not in the cache
+        are given to the underlying prediction function all at once.
+
+        Raises:
+            InvalidReactionSmiles if one of the strings is not a reaction SMILES.
+        """
+        canonical_reactions = [
+            canonicalize_reaction(smiles, fragment_bond=self.fragment_bond)
+            for smiles in reaction_smiles_list
+        ]
+        keys = list(dict.fromkeys(c.reaction_smiles for c in canonical_reactions))
+
+        cached = self._get_cached(keys)
+        missing_keys = [key for key in keys if key not in cached]
+        if missing_keys:
+            predictions = self.predict_many_fn(missing_keys)
+            new_entries = {key: p.candidates for key, p in zip(missing_keys, predictions)}
+            self._put_cached(new_entries)
+            cached.update(new_entries)
+
+        return [
+            ActionPrediction(
+                reaction_smiles=smiles,
+                candidates=[
+                    # The detokenized actions do not depend on the order of the molecules
+                    attr.evolve(
+                        candidate,
+                        raw=remap_compound_placeholders(
+                            candidate.raw, canonical_reaction.original_positions
+                        )
+                    ) for candidate in cached[canonical_reaction.reaction_smiles]
+                ]
+            ) for smiles, canonical_reaction in zip(reaction_smiles_list, canonical_reactions)
+        ]
+
+    def cache_statistics(self) -> CacheStatistics:
+        """Statistics of the in-memory cache."""
+        with self._memory_cache_lock:
+            return self._memory_cache.statistics()
+
+    def close(self) -> None:
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
+    def _get_cached(self, keys: List[str]) -> Dict[str, List[PredictedActions]]:
+        cached: Dict[str, List[PredictedActions]] = {}
+        with self._memory_cache_lock:
+            for key in keys:
+                candidates = self._memory_cache.get(key)
+                if candidates is not None:
+                    cached[key] = candidates
+
+        if self._disk_cache is not None:
+            from_disk = {
+                key: self._deserialize(value)
+                for key, value in
+                self._disk_cache.get_many(key for key in keys if key not in cached).items()
+            }
+            with self._memory_cache_lock:
+                for key, candidates in from_disk.items():
+                    self._memory_cache.put(key, candidates)
+            cached.update(from_disk)
+
+        return cached
+
+    def _put_cached(self, entries: Dict[str, List[PredictedActions]]) -> None:
+        with self._memory_cache_lock:
+            for key, candidates in entries.items():
+                self._memory_cache.put(key, candidates)
+        if self._disk_cache is not None:
+            self._disk_cache.update(
+                (key, self._serialize(candidates)) for key, candidates in entries.items()
+            )
+
+    @staticmethod
+    def _serialize(candidates: List[PredictedActions]) -> str:
+        return json.dumps([attr.astuple(c) for c in candidates])
+
+    @staticmethod
+    def _deserialize(value: str) -> List[PredictedActions]:
+        return [PredictedActions(*c) for c in json.loads(value)]
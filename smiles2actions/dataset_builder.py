@@ -0,0 +1,221 @@
+import multiprocessing
+from collections import Counter
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import attr
+from paragraph2actions.action_string_converter import ReadableConverter
+from paragraph2actions.actions import Action
+from paragraph2actions.utils import extract_chemicals
+
+from .action_sequence_refiner import ActionSequenceRefiner
+from .action_sequence_validator import ActionSequenceValidator
+from .molecule_position import MoleculePosition
+from .name_to_smiles import NameToSmiles
+from .placeholder_handler import PlaceholderHandler
+from .tokenization import tokenize_smiles
+from .utils import ReactionEquation
+
+
+class ActionStringConversionError(ValueError):
+
+    def __init__(self, actions_string: str):
+        super().__init__(f'Cannot convert "{actions_string}" to actions.')
+
+
+class InadmissibleCompound(ValueError):
+
+    def __init__(self, name: str):
+        super().__init__(f'"{name}" is not admissible')
+
+
+@attr.s(auto_attribs=True)
+class DatasetSample:
+    """Sample for training the SMILES-to-actions model."""
+    src: str
+    tgt: str
+
+
+@attr.s(auto_attribs=True)
+class SampleProcessingResult:
+    """
+    Result of the processing of one reaction and its actions.
+
+    Exactly one of "sample" and "rejection_reason" is set.
+    """
+    sample: Optional[DatasetSample] = None
+    rejection_reason: Optional[str] = None
+
+
+class CompoundTokenizer:
+    """
+    Replaces the compound names in actions by placeholders for their
+    position in the reaction ($1$, $2$, ..., $-1$ for the product, etc.).
+    """
+
+    def __init__(self, name_to_smiles: NameToSmiles, admissible_reagents: Iterable[str]):
+        """
+        Args:
+            name_to_smiles: converter from compound names to SMILES strings.
+            admissible_reagents: compound names that can remain in the actions
+                if they are not found in the reaction.
+        """
+        self.name_to_smiles = name_to_smiles
+        self.admissible_reagents = set(admissible_reagents)
+        self.placeholder_handler = PlaceholderHandler.for_compounds()
+
+    def tokenize(self, actions: List[Action], reaction_equation: ReactionEquation) -> None:
+        """
+        Tokenize the compound names of a list of actions, in-place.
+
+        Raises:
+            InadmissibleCompound if a compound can neither be found in the
+            reaction nor among the admissible reagents.
+        """
+        molecule_position = MoleculePosition(reaction_equation)
+
+        for chemical in extract_chemicals(actions, ignore_sln=True):
+            smiles = self.name_to_smiles.try_get_smiles(chemical.name)
+            if smiles is not None:
+                try:
+                    position = molecule_position.get_position_for_smiles(smiles)
+                    chemical.name = self.placeholder_handler.to_placeholder(position)
+                    continue
+                except ValueError:
+                    pass
+            if chemical.name in self.admissible_reagents:
+                continue
+            raise InadmissibleCompound(chemical.name)
+
+
+class DatasetSampleProcessor:
+    """
+    Converts a reaction SMILES and the corresponding action string to a
+    sample for the SMILES-to-actions model, by refining, validating and
+    tokenizing the actions.
+    """
+
+    def __init__(
+        self,
+        name_to_smiles: NameToSmiles,
+        admissible_reagents: Iterable[str],
+        fragment_bond: str = '~'
+    ):
+        """
+        Args:
+            name_to_smiles: converter from compound names to SMILES strings.
+            admissible_reagents: compound names that can remain in the actions
+                if they are not found in the reaction.
+            fragment_bond: fragment bond in the reaction SMILES.
+        """
+        self.fragment_bond = fragment_bond
+        self.converter = ReadableConverter(separator=' ; ', end_mark='')
+        self.refiner = ActionSequenceRefiner()
+        self.validator = ActionSequenceValidator()
+        self.compound_tokenizer = CompoundTokenizer(
+            name_to_smiles=name_to_smiles, admissible_reagents=admissible_reagents
+        )
+
+    def process(self, reaction_smiles: str, actions_string: str) -> SampleProcessingResult:
+        try:
+            sample = self.process_or_raise(reaction_smiles, actions_string)
+            return SampleProcessingResult(sample=sample)
+        except ValueError as e:
+            return SampleProcessingResult(rejection_reason=e.__class__.__name__)
+
+    def process_or_raise(self, reaction_smiles: str, actions_string: str) -> DatasetSample:
+        """
+        Raises:
+            ValueError (or subclass) if the reaction and actions cannot be
+            converted to a sample.
+        """
+        reaction_equation = ReactionEquation.from_string(
+            reaction_smiles, fragment_bond=self.fragment_bond
+        )
+
+        actions = self._string_to_actions(actions_string)
+        actions = self.refiner.refine(actions)
+        self.validator.validate(actions)
+
+        self.compound_tokenizer.tokenize(actions, reaction_equation)
+
+        return DatasetSample(
+            src=tokenize_smiles(reaction_smiles), tgt=self.converter.actions_to_string(actions)
+        )
+
+    def _string_to_actions(self, actions_string: str) -> List[Action]:
+        try:
+            return self.converter.string_to_actions(actions_string)
+        except Exception as e:
+            # The converter raises different kinds of exceptions for unparsable strings
+            raise ActionStringConversionError(actions_string) from e
+
+
+def build_dataset(
+    reactions_and_actions: Iterable[Tuple[str, str]],
+    processor_factory: Callable[[], DatasetSampleProcessor],
+    src_file: TextIO,
+    tgt_file: TextIO,
+    n_jobs: int = 1,
+    chunksize: int = 256
+) -> Counter:
+    """
+    Build the src and tgt files for training the SMILES-to-actions model.
+
+    The input is streamed and the samples are written as soon as they are
+    available, so that the memory usage does not depend on the input size.
+
+    Args:
+        reactions_and_actions: tuples of reaction SMILES and action strings.
+        processor_factory: function creating the sample processor. Called
+            once per worker process.
+        src_file: where to write the tokenized reaction SMILES.
+        tgt_file: where to write the tokenized actions.
+        n_jobs: number of worker processes. With 1, the processing happens
+            in the current process.
+        chunksize: number of samples sent to a worker at once.
+
+    Returns:
+        Counter for the number of accepted samples ("accepted" key) and
+        for the rejected samples (by rejection reason).
+    """
+    counter: Counter = Counter()
+
+    for result in _process_all(reactions_and_actions, processor_factory, n_jobs, chunksize):
+        if result.sample is None:
+            counter[result.rejection_reason] += 1
+            continue
+        counter['accepted'] += 1
+        src_file.write(result.sample.src + '\n')
+        tgt_file.write(result.sample.tgt + '\n')
+
+    return counter
+
+
+def _process_all(
+    reactions_and_actions: Iterable[Tuple[str, str]],
+    processor_factory: Callable[[], DatasetSampleProcessor], n_jobs: int, chunksize: int
+) -> Iterator[SampleProcessingResult]:
+    if n_jobs == 1:
+        processor = processor_factory()
+        for reaction_smiles, actions_string in reactions_and_actions:
+            yield processor.process(reaction_smiles, actions_string)
+        return
+
+    with multiprocessing.Pool(
+        n_jobs, initializer=_initialize_worker, initargs=(processor_factory, )
+    ) as pool:
+        yield from pool.imap(_process_in_worker, reactions_and_actions, chunksize=chunksize)
+
+
+# Sample processor of the current worker process, built once by _initialize_worker.
+_worker_processor: Optional[DatasetSampleProcessor] = None
+
+
+def _initialize_worker(processor_factory: Callable[[], DatasetSampleProcessor]) -> None:
+    global _worker_processor
+    _worker_processor = processor_factory()
+
+
+def _process_in_worker(reaction_and_actions: Tuple[str, str]) -> SampleProcessingResult:
+    assert _worker_processor is not None
+    return _worker_processor.process(*reaction_and_actions)
@@ -1,5 +1,7 @@
-from typing import Dict, Callable, Optional
+import multiprocessing
+from typing import Dict, Callable, Iterable, List, Optional
 
+from .lru_cache import LRUCache
 from .name_to_smiles import NameToSmiles, NameToSmilesError
 
 
@@ -9,18 +11,76 @@ class DictBasedNameToSmiles(NameToSmiles):
     """
 
     def __init__(
-        self, mapping: Dict[str, str], normalize_fn: Optional[Callable[[str], str]] = None
+        self,
+        mapping: Dict[str, str],
+        normalize_fn: Optional[Callable[[str], str]] = None,
+        normalization_cache_size: int = 0,
+        n_jobs: Optional[int] = 1,
+        chunksize: int = 10000
     ):
+        """
+        Args:
+            mapping: dictionary from compound names to SMILES strings.
+            normalize_fn: normalization function for the names.
+            normalization_cache_size: number of queried names for which to keep
+                the normalized name in memory. With 0, nothing is cached. The
+                cache is not thread-safe: only enable it for instances used by
+                one thread at a time.
+            n_jobs: number of worker processes for normalizing the names of the
+                mapping. None for the number of CPUs. The normalization function
+                must be picklable if different from 1.
+            chunksize: number of names sent to a worker at once.
+        """
         self.mapping = mapping
         self.normalize_fn = normalize_fn
+        self.normalization_cache: Optional[LRUCache[str, str]] = None
+        if normalization_cache_size > 0:
+            self.normalization_cache = LRUCache(maxsize=normalization_cache_size)
 
         if self.normalize_fn is not None:
-            self.mapping = {self.normalize_fn(key): value for key, value in self.mapping.items()}
+            normalized_names = self._normalize_all(list(self.mapping.keys()), n_jobs, chunksize)
+            self.mapping = dict(zip(normalized_names, self.mapping.values()))
 
     def get_smiles(self, name: str) -> str:
-        try:
-            if self.normalize_fn is not None:
-                name = self.normalize_fn(name)
-            return self.mapping[name]
-        except KeyError as e:
-            raise NameToSmilesError(name) from e
+        key = self._normalize(name)
+        smiles = self.mapping.get(key)
+        if smiles is None:
+            raise NameToSmilesError(key)
+        return smiles
+
+    def try_get_smiles(self, name: str) -> Optional[str]:
+        return self.mapping.get(self._normalize(name))
+
+    def get_smiles_many(self, names: Iterable[str]) -> Dict[str, str]:
+        keys = {name: self._normalize(name) for name in names}
+        smiles: Dict[str, str] = {}
+        # Different names may have the same normalized name; it is looked up once
+        for key in dict.fromkeys(keys.values()):
+            value = self.mapping.get(key)
+            if value is not None:
+                smiles[key] = value
+        return {name: smiles[key] for name, key in keys.items() if key in smiles}
+
+    def _normalize(self, name: str) -> str:
+        if self.normalize_fn is None:
+            return name
+        if self.normalization_cache is None:
+            return self.normalize_fn(name)
+
+        normalized_name = self.normalization_cache.get(name)
+        if normalized_name is None:
+            normalized_name = self.normalize_fn(name)
+            self.normalization_cache.put(name, normalized_name)
+        return normalized_name
+
+    def _normalize_all(self, names: List[str], n_jobs: Optional[int], chunksize: int) -> List[str]:
+        assert self.normalize_fn is not None
+
+        if n_jobs is None:
+            n_jobs = multiprocessing.cpu_count()
+
+        if n_jobs == 1 or len(names) <= chunksize:
+            return [self.normalize_fn(name) for name in names]
+
+        with multiprocessing.Pool(n_jobs) as pool:
+            return pool.map(self.normalize_fn, names, chunksize=chunksize)
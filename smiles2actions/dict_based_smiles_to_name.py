@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Iterable, Optional
 
 from .smiles_to_name import SmilesToName, SmilesToNameError
 
@@ -12,7 +12,18 @@ class DictBasedSmilesToName(SmilesToName):
         self.mapping = mapping
 
     def get_name(self, smiles: str) -> str:
-        try:
-            return self.mapping[smiles]
-        except KeyError as e:
-            raise SmilesToNameError(smiles) from e
+        name = self.mapping.get(smiles)
+        if name is None:
+            raise SmilesToNameError(smiles)
+        return name
+
+    def try_get_name(self, smiles: str) -> Optional[str]:
+        return self.mapping.get(smiles)
+
+    def get_name_many(self, smiles_strings: Iterable[str]) -> Dict[str, str]:
+        names: Dict[str, str] = {}
+        for smiles in dict.fromkeys(smiles_strings):  # removes the duplicates
+            name = self.mapping.get(smiles)
+            if name is not None:
+                names[smiles] = name
+        return names
@@ -0,0 +1,110 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class DynamicBatcher(Generic[T, R]):
+    """
+    Groups the items submitted concurrently (f.i. by the threads of a server)
+    into batches, processed one after the other in a background thread.
+
+    A batch is processed as soon as it contains max_batch_size items, or when
+    its first item has waited for max_latency seconds; an item therefore waits
+    at most max_latency seconds (plus the processing time of the previous batch)
+    before being processed.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[T]], List[R]],
+        max_batch_size: int = 32,
+        max_latency: float = 0.05,
+    ):
+        """
+        Args:
+            process_batch: function processing a batch of items, returning one result per item.
+            max_batch_size: maximal number of items per batch.
+            max_latency: maximal time, in seconds, to wait for more items before processing a batch.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f'Invalid batch size: {max_batch_size}')
+
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+
+        self._queue: 'queue.Queue[Optional[Tuple[T, Future]]]' = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='DynamicBatcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, item: T) -> 'Future[R]':
+        """Submit an item; the result (or the exception of process_batch) is given by the future."""
+        if not self._thread.is_alive():
+            raise RuntimeError('The batcher has been stopped')
+        future: 'Future[R]' = Future()
+        self._queue.put((item, future))
+        return future
+
+    def process(self, item: T) -> R:
+        """Submit an item and wait for its result."""
+        return self.submit(item).result()
+
+    def stop(self) -> None:
+        """Process the items already submitted, and stop the background thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            batch, stop = self._next_batch()
+            if batch:
+                self._process(batch)
+            if stop:
+                return
+
+    def _next_batch(self) -> Tuple[List[Tuple[T, Future]], bool]:
+        """
+        Wait for the items of the next batch.
+
+        Returns:
+            Tuple: the items with their futures, and whether the batcher was stopped.
+        """
+        entry = self._queue.get()
+        if entry is None:
+            return [], True
+
+        batch = [entry]
+        deadline = time.monotonic() + self.max_latency
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                entry = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is None:
+                return batch, True
+            batch.append(entry)
+        return batch, False
+
+    def _process(self, batch: List[Tuple[T, Future]]) -> None:
+        # Items whose caller is not waiting anymore are skipped
+        batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            results = self.process_batch([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f'Got {len(results)} results for a batch of {len(batch)} items'
+                )
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
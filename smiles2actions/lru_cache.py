@@ -0,0 +1,118 @@
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from typing import Generic, Hashable, Optional, TypeVar, Union
+
+import attr
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+_missing = object()
+
+
+@attr.s(auto_attribs=True)
+class CacheStatistics:
+    """Usage statistics of a cache."""
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Bounded mapping that discards the least recently used entries first.
+
+    Contrary to functools.lru_cache, it can be inspected, resized, and
+    persisted to disk between runs.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        """
+        Args:
+            maxsize: maximal number of entries to keep. With 0, nothing is cached.
+        """
+        if maxsize < 0:
+            raise ValueError(f'Invalid cache size: {maxsize}')
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: 'OrderedDict[K, V]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._data
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Get the value for a key, and mark it as most recently used.
+
+        Counts as a hit or a miss for the statistics.
+        """
+        value = self._data.get(key, _missing)
+        if value is _missing:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value  # type: ignore
+
+    def put(self, key: K, value: V) -> None:
+        """Add an entry, discarding the least recently used one if the cache is full."""
+        if self.maxsize == 0:
+            return
+
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._discard_excess_entries()
+
+    def resize(self, maxsize: int) -> None:
+        """Change the capacity, keeping the most recently used entries."""
+        if maxsize < 0:
+            raise ValueError(f'Invalid cache size: {maxsize}')
+
+        self.maxsize = maxsize
+        self._discard_excess_entries()
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the statistics."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def statistics(self) -> CacheStatistics:
+        return CacheStatistics(
+            hits=self.hits, misses=self.misses, size=len(self._data), maxsize=self.maxsize
+        )
+
+    def save(self, filename: Union[Path, str]) -> None:
+        """Pickle the cache entries (not the statistics) to a file."""
+        with open(str(filename), 'wb') as f:
+            pickle.dump(list(self._data.items()), f)
+
+    def load(self, filename: Union[Path, str]) -> None:
+        """
+        Add the entries pickled with save() to the cache.
+
+        The loaded entries are considered as more recent than the ones already present.
+        """
+        with open(str(filename), 'rb') as f:
+            items = pickle.load(f)
+        for key, value in items:
+            self.put(key, value)
+
+    def _discard_excess_entries(self) -> None:
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
@@ -0,0 +1,64 @@
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Union
+
+from .name_to_smiles import NameToSmiles, NameToSmilesError
+from .sorted_key_value_file import SortedKeyValueFile, build_sorted_key_value_file
+from .utils import iterate_tsv_pairs
+
+
+class MmapBasedNameToSmiles(NameToSmiles):
+    """
+    NameToSmiles based on a memory-mapped file, for mappings too large to be
+    held in memory as a dictionary (see SortedKeyValueFile).
+    """
+
+    def __init__(
+        self, filename: Union[Path, str], normalize_fn: Optional[Callable[[str], str]] = None
+    ):
+        """
+        Args:
+            filename: file created with from_tsv() or build_sorted_key_value_file().
+            normalize_fn: normalization function for the names, must be the
+                same as the one used when creating the file.
+        """
+        self.mapping = SortedKeyValueFile(filename)
+        self.normalize_fn = normalize_fn
+
+    @classmethod
+    def from_tsv(
+        cls,
+        tsv_file: Union[Path, str],
+        filename: Union[Path, str],
+        normalize_fn: Optional[Callable[[str], str]] = None
+    ) -> 'MmapBasedNameToSmiles':
+        """
+        Create the file from a TSV file with the names in the first column and
+        the SMILES strings in the second one, and open it.
+        """
+        build_sorted_key_value_file(iterate_tsv_pairs(tsv_file), filename, key_fn=normalize_fn)
+        return cls(filename, normalize_fn=normalize_fn)
+
+    def get_smiles(self, name: str) -> str:
+        key = self._normalize(name)
+        smiles = self.mapping.get(key)
+        if smiles is None:
+            raise NameToSmilesError(key)
+        return smiles
+
+    def try_get_smiles(self, name: str) -> Optional[str]:
+        return self.mapping.get(self._normalize(name))
+
+    def get_smiles_many(self, names: Iterable[str]) -> Dict[str, str]:
+        keys = {name: self._normalize(name) for name in names}
+        smiles: Dict[str, str] = {}
+        # Different names may have the same normalized name; it is looked up once
+        for key in dict.fromkeys(keys.values()):
+            value = self.mapping.get(key)
+            if value is not None:
+                smiles[key] = value
+        return {name: smiles[key] for name, key in keys.items() if key in smiles}
+
+    def _normalize(self, name: str) -> str:
+        if self.normalize_fn is None:
+            return name
+        return self.normalize_fn(name)
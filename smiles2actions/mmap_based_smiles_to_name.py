@@ -0,0 +1,47 @@
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from .smiles_to_name import SmilesToName, SmilesToNameError
+from .sorted_key_value_file import SortedKeyValueFile, build_sorted_key_value_file
+from .utils import iterate_tsv_pairs
+
+
+class MmapBasedSmilesToName(SmilesToName):
+    """
+    SmilesToName based on a memory-mapped file, for mappings too large to be
+    held in memory as a dictionary (see SortedKeyValueFile).
+    """
+
+    def __init__(self, filename: Union[Path, str]):
+        """
+        Args:
+            filename: file created with from_tsv() or build_sorted_key_value_file().
+        """
+        self.mapping = SortedKeyValueFile(filename)
+
+    @classmethod
+    def from_tsv(cls, tsv_file: Union[Path, str],
+                 filename: Union[Path, str]) -> 'MmapBasedSmilesToName':
+        """
+        Create the file from a TSV file with the SMILES strings in the first
+        column and the names in the second one, and open it.
+        """
+        build_sorted_key_value_file(iterate_tsv_pairs(tsv_file), filename)
+        return cls(filename)
+
+    def get_name(self, smiles: str) -> str:
+        name = self.mapping.get(smiles)
+        if name is None:
+            raise SmilesToNameError(smiles)
+        return name
+
+    def try_get_name(self, smiles: str) -> Optional[str]:
+        return self.mapping.get(smiles)
+
+    def get_name_many(self, smiles_strings: Iterable[str]) -> Dict[str, str]:
+        names: Dict[str, str] = {}
+        for smiles in dict.fromkeys(smiles_strings):  # removes the duplicates
+            name = self.mapping.get(smiles)
+            if name is not None:
+                names[smiles] = name
+        return names
@@ -1,5 +1,5 @@
 import re
-from typing import List, Tuple, Pattern
+from typing import Dict, List, Pattern, Tuple
 
 from .compound_name_trimmer import CompoundNameTrimmer
 from ..regex_utils import alternation
@@ -36,20 +36,44 @@ class MultipleCompoundDetector:
     def _filter_out_slices(self, slices: List[slice], name: str) -> List[slice]:
         """
         Iteratively removes splits that are not needed.
+
+        The splits are removed one at a time, always the leftmost one that is
+        not needed. Removing a split only modifies the neighbors of the
+        adjacent splits; therefore, the splits before it do not need to be
+        evaluated again, and the evaluation resumes at the previous split.
+        The trimmed components are cached by span, to trim every one of them once only.
         """
         slices = list(slices)  # copy to avoid overwriting the original list
-        current_number_slices = 0
-
-        while len(slices) != current_number_slices:
-            current_number_slices = len(slices)
-            slices_and_neighbors = self._slice_and_neighbors_for_split(name, slices)
-            for s, left, right in slices_and_neighbors:
-                separator = name[s]
-                if not self.keep_split(separator, left, right):
-                    slices.remove(s)
-                    break
+        trimmed_components: Dict[Tuple[int, int], str] = {}
+
+        index = 0
+        while index < len(slices):
+            s = slices[index]
+            left = self._trimmed_component(name, slices, index, trimmed_components)
+            right = self._trimmed_component(name, slices, index + 1, trimmed_components)
+            if self.keep_split(name[s], left, right):
+                index += 1
+            else:
+                del slices[index]
+                index = max(index - 1, 0)
         return slices
 
+    def _trimmed_component(
+        self, name: str, splits: List[slice], index: int, cache: Dict[Tuple[int, int], str]
+    ) -> str:
+        """
+        Get the trimmed component of the name preceding the split at the given index
+        (or the last component if the index is equal to the number of splits).
+        """
+        start = splits[index - 1].stop if index > 0 else 0
+        stop = splits[index].start if index < len(splits) else len(name)
+        try:
+            return cache[(start, stop)]
+        except KeyError:
+            component = self.trimmer.trim(name[start:stop])
+            cache[(start, stop)] = component
+            return component
+
     def keep_split(self, separator: str, left: str, right: str) -> bool:
         """
         Checks whether a split must be kept or not.
@@ -78,13 +102,6 @@ class MultipleCompoundDetector:
         # apply cleanup
         return [self.trimmer.trim(c) for c in components]
 
-    def _slice_and_neighbors_for_split(self, name: str,
-                                       splits: List[slice]) -> List[Tuple[slice, str, str]]:
-        components = self._subcompounds_from_splits(name, splits)
-
-        # there is always one component more than there are splits, we just need to link them
-        return [(splits[i], components[i], components[i + 1]) for i in range(len(splits))]
-
     def _slices_for_appended_parentheses(self, name: str) -> List[slice]:
         """
         Often, the solvent in which something is solved is added as a parenthesis, such as "HCl (THF)"
@@ -3,7 +3,7 @@ import re
 from typing import List
 
 from .filter import Filter
-from ..regex_utils import RegexMatch, match_all, alternation, optional, capturing
+from ..regex_utils import RegexMatch, alternation, optional, capturing
 from ..utils import dash_characters
 
 
@@ -26,6 +26,22 @@ class ReferencedCompoundFilter(Filter):
         separator = alternation([r'\.', ' '] + dash_characters)
         self.one_or_two_groups = f'{self.one_or_two_components}{optional(separator + self.one_or_two_components)}'
 
+        # Patterns to look for at the end of the name, by order of priority
+        self.end_regexes = [
+            # combination of two with separator
+            re.compile(rf' {self.one_or_two_groups}$'),
+            # simple match of one or two components, with optional hash
+            re.compile(rf' #?{self.one_or_two_components}$'),
+            # combination of two with with parenthesis or bracket
+            re.compile(rf' [\(\[] ?{self.one_or_two_groups} ?[\)\]]$'),
+        ]
+        # A match for the patterns above contains at most four spaces (the
+        # initial one, the separator, and around the groups in parentheses).
+        self.max_spaces_in_match = 4
+
+        parenthesis_regex = rf'\({capturing(".*")}\)'
+        self.parenthesis_regex = re.compile(rf'^{parenthesis_regex}$')
+
     def find_matches(self, chemical_name: str) -> List[RegexMatch]:
         matches = self._find_impl(f' {chemical_name}')
         # remove the space at the beginning of the match, but account for the additional space introduced
@@ -37,27 +53,30 @@ class ReferencedCompoundFilter(Filter):
         return matches
 
     def _find_impl(self, name: str) -> List[RegexMatch]:
-        # combination of two with separator
-        matches = match_all(rf' {self.one_or_two_groups}$', name)
-        if matches:
-            return matches
+        # All the patterns are anchored at the end of the name and start with a space:
+        # a match can only start at one of the last spaces, and there is at most one.
+        start_position = self._tail_start(name)
 
-        # simple match of one or two components, with optional hash
-        matches = match_all(rf' #?{self.one_or_two_components}$', name)
-        if matches:
-            return matches
-
-        # combination of two with with parenthesis or bracket
-        matches = match_all(rf' [\(\[] ?{self.one_or_two_groups} ?[\)\]]$', name)
-        if matches:
-            return matches
+        for regex in self.end_regexes:
+            match = regex.search(name, start_position)
+            if match is not None:
+                return [RegexMatch(span=slice(*match.span()), text=match.group(0))]
 
         return []
 
+    def _tail_start(self, name: str) -> int:
+        """Position of the earliest space a match can start at."""
+        position = len(name)
+        for _ in range(self.max_spaces_in_match):
+            space_position = name.rfind(' ', 0, position)
+            if space_position == -1:
+                break
+            position = space_position
+        return 0 if position == len(name) else position
+
     def _is_exception(self, s: str) -> bool:
         # check for oxidation numbers in parentheses
-        parenthesis_regex = rf'\({capturing(".*")}\)'
-        roman_number_match = re.match(rf'^{parenthesis_regex}$', s)
+        roman_number_match = self.parenthesis_regex.match(s)
         if roman_number_match is not None:
             content = roman_number_match.group(1)
             if content in ['0', 'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII']:
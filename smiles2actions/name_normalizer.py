@@ -1,9 +1,12 @@
 import re
-from typing import Callable, List
+from typing import Callable, Dict, List, Optional, Union
 
 from .regex_utils import alternation
 from .utils import dash_characters
 
+TranslationTable = Dict[int, Optional[str]]
+NormalizationStep = Union[TranslationTable, Callable[[str], str]]
+
 
 class NameNormalizer:
     """
@@ -13,6 +16,10 @@ class NameNormalizer:
     - character used for prime / dash
     - uppercase / lowercase
     - etc
+
+    In compiled mode, the consecutive character-level substitutions are
+    merged into one translation table, so that a name is processed in a few
+    passes only; the output is identical.
     """
 
     def __init__(
@@ -26,7 +33,8 @@ class NameNormalizer:
         remove_spaces: bool = False,
         remove_dashes: bool = False,
         remove_primes: bool = False,
-        remove_special_characters: bool = False
+        remove_special_characters: bool = False,
+        compiled: bool = False
     ):
         """
         Args:
@@ -40,17 +48,34 @@ class NameNormalizer:
             remove_dashes: removes all kinds of dashes
             remove_primes: removes all kinds of primes
             remove_special_characters: removes other special characters
+            compiled: whether to merge the character-level substitutions into translation tables
         """
 
         self.normalization_fns: List[Callable[[str], str]] = []
         self.subscript_digitmap = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
         self.dash_regex = re.compile(alternation(dash_characters))
         self.default_dash_character = '-'
-        self.prime_regex = re.compile(alternation(['\'', 'ʹ', '′', '’', '″', 'ʺ']))
+        self.prime_characters = ['\'', 'ʹ', '′', '’', '″', 'ʺ']
+        self.prime_regex = re.compile(alternation(self.prime_characters))
         self.default_prime_character = '\''
+        self.special_characters = list('±↑⊐×°□®™●•·⋅˙\u200C*')
         self.special_character_regex = re.compile(
-            alternation([c for c in '±↑⊐×°□®™●•·⋅˙\u200C'] + [r'\*'])
+            alternation([re.escape(c) for c in self.special_characters])
         )
+        self.greek_letters = {'alpha': 'α', 'beta': 'β', 'gamma': 'γ'}
+        self.greek_letter_regex = re.compile(rf'\b{alternation(list(self.greek_letters))}\b')
+
+        # Characters modified by the character-level substitutions
+        self.character_sets: Dict[Callable[[str], str], str] = {
+            self.normalize_subscripts: '₀₁₂₃₄₅₆₇₈₉',
+            self.normalize_potential_ocr_errors: 'I10',
+            self.normalize_dashes: ''.join(dash_characters),
+            self.normalize_primes: ''.join(self.prime_characters),
+            self.remove_spaces: ' ',
+            self.remove_dashes: ''.join(dash_characters),
+            self.remove_primes: ''.join(self.prime_characters),
+            self.remove_special_characters: ''.join(self.special_characters),
+        }
 
         if normalize_subscripts:
             self.normalization_fns.append(self.normalize_subscripts)
@@ -82,14 +107,66 @@ class NameNormalizer:
         if remove_special_characters:
             self.normalization_fns.append(self.remove_special_characters)
 
+        self.compiled = compiled
+        self.compiled_steps: List[NormalizationStep] = []
+        if compiled:
+            self.compiled_steps = self._compile(self.normalization_fns)
+
     def __call__(self, name: str) -> str:
         return self.normalize(name)
 
     def normalize(self, name: str) -> str:
+        if self.compiled:
+            return self._normalize_compiled(name)
         for fn in self.normalization_fns:
             name = fn(name)
         return name
 
+    def _normalize_compiled(self, name: str) -> str:
+        for step in self.compiled_steps:
+            if isinstance(step, dict):
+                name = name.translate(step)
+            else:
+                name = step(name)
+        return name
+
+    def _compile(self, fns: List[Callable[[str], str]]) -> List[NormalizationStep]:
+        """
+        Merge the consecutive character-level substitutions into translation tables.
+
+        The case normalization (str.lower is context-dependent for the final
+        sigma) and the normalization of Greek letters (word-level) remain
+        separate steps.
+        """
+        steps: List[NormalizationStep] = []
+        character_level_fns: List[Callable[[str], str]] = []
+
+        for fn in fns:
+            if fn in self.character_sets:
+                character_level_fns.append(fn)
+                continue
+            if character_level_fns:
+                steps.append(self._translation_table(character_level_fns))
+                character_level_fns = []
+            steps.append(fn)
+        if character_level_fns:
+            steps.append(self._translation_table(character_level_fns))
+
+        return steps
+
+    def _translation_table(self, fns: List[Callable[[str], str]]) -> TranslationTable:
+        """Translation table equivalent to applying the given character-level substitutions."""
+        characters = set(''.join(self.character_sets[fn] for fn in fns))
+        table: TranslationTable = {}
+        for character in characters:
+            substitution = character
+            for fn in fns:
+                substitution = fn(substitution)
+            if substitution != character:
+                # None instead of '' for removals, which str.translate handles faster
+                table[ord(character)] = substitution if substitution else None
+        return table
+
     def normalize_subscripts(self, name: str) -> str:
         return name.translate(self.subscript_digitmap)
 
@@ -103,10 +180,13 @@ class NameNormalizer:
         return self.prime_regex.sub(self.default_prime_character, name)
 
     def normalize_greek_letters(self, name: str) -> str:
-        name = re.sub(r'\balpha\b', 'α', name)
-        name = re.sub(r'\bbeta\b', 'β', name)
-        name = re.sub(r'\bgamma\b', 'γ', name)
-        return name
+        # Avoids the (slower) regex for the names without Greek letters
+        for letter in self.greek_letters:
+            if letter in name:
+                break
+        else:
+            return name
+        return self.greek_letter_regex.sub(lambda m: self.greek_letters[m.group()], name)
 
     def normalize_potential_ocr_errors(self, name: str) -> str:
         name = name.replace('I', 'l')
@@ -127,7 +207,7 @@ class NameNormalizer:
         return self.special_character_regex.sub('', name)
 
     @classmethod
-    def default_normalizer(cls) -> 'NameNormalizer':
+    def default_normalizer(cls, compiled: bool = True) -> 'NameNormalizer':
         # Normalizes everything
         return NameNormalizer(
             normalize_subscripts=True,
@@ -139,5 +219,6 @@ class NameNormalizer:
             remove_spaces=True,
             remove_dashes=True,
             remove_primes=True,
-            remove_special_characters=True
+            remove_special_characters=True,
+            compiled=compiled
         )
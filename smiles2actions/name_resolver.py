@@ -0,0 +1,106 @@
+from typing import Dict, Generator, Iterable, List, Optional, Set
+
+import attr
+
+from .name_simplifier import NameSimplifier
+from .name_to_smiles import NameToSmiles
+
+
+@attr.s(auto_attribs=True)
+class ResolvedName:
+    """
+    Result of the resolution of a compound name.
+
+    Attributes:
+        names: simplified names, all of them having a SMILES string.
+        smiles: SMILES strings for the simplified names, in the same order.
+    """
+    names: List[str]
+    smiles: List[str]
+
+
+class NameResolver:
+    """
+    Resolves compound names to SMILES strings, by simplifying them until all
+    the simplified names have a SMILES string.
+
+    The simplifications of all the names are evaluated stage by stage, so
+    that the candidate names of one stage are looked up at once with
+    NameToSmiles.get_smiles_many. Every distinct candidate name is looked
+    up only once; within a stage, the candidate names with the same
+    normalized name (f.i. different spellings) result in one lookup.
+    """
+
+    def __init__(
+        self,
+        name_to_smiles: NameToSmiles,
+        name_simplifier: Optional[NameSimplifier] = None,
+    ):
+        """
+        Args:
+            name_to_smiles: converter from compound names to SMILES strings.
+            name_simplifier: name simplifier to use. Defaults to a NameSimplifier
+                without caching.
+        """
+        if name_simplifier is None:
+            name_simplifier = NameSimplifier()
+
+        self.name_to_smiles = name_to_smiles
+        self.name_simplifier = name_simplifier
+
+    def resolve(self, name: str) -> Optional[ResolvedName]:
+        """
+        Resolve one compound name.
+
+        Returns:
+            The resolved name, or None if no simplification could be resolved.
+        """
+        return self.resolve_many([name])[name]
+
+    def resolve_many(self, names: Iterable[str]) -> Dict[str, Optional[ResolvedName]]:
+        """
+        Resolve several compound names.
+
+        Args:
+            names: compound names. May contain duplicates.
+
+        Returns:
+            Dictionary from the names to their resolution (None for the names
+            that could not be resolved).
+        """
+        unique_names = list(dict.fromkeys(names))
+        results: Dict[str, Optional[ResolvedName]] = {}
+
+        # Simplifications still to evaluate, for the names not resolved yet
+        pending: Dict[str, Generator[List[str], None, None]] = {
+            name: self.name_simplifier.simplify(name)
+            for name in unique_names
+        }
+
+        # SMILES strings for the candidate names that were looked up already
+        known_smiles: Dict[str, str] = {}
+        looked_up: Set[str] = set()
+
+        while pending:
+            # Next simplification of every pending name
+            candidates: Dict[str, List[str]] = {}
+            for name, simplifications in pending.items():
+                simplified_names = next(simplifications, None)
+                if simplified_names is None:
+                    results[name] = None
+                else:
+                    candidates[name] = simplified_names
+
+            new_names = {n for names in candidates.values() for n in names} - looked_up
+            known_smiles.update(self.name_to_smiles.get_smiles_many(new_names))
+            looked_up.update(new_names)
+
+            pending = {name: pending[name] for name in candidates}
+            for name, simplified_names in candidates.items():
+                if all(n in known_smiles for n in simplified_names):
+                    results[name] = ResolvedName(
+                        names=simplified_names, smiles=[known_smiles[n] for n in simplified_names]
+                    )
+                    del pending[name]
+
+        return {name: results[name] for name in unique_names}
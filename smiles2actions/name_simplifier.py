@@ -1,7 +1,35 @@
-from typing import List, Generator, Set, Tuple
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Generator, Optional, Set, Tuple
 
+import attr
+
+from . import profiling
 from .core_name_extractor import CoreNameExtractor
 from .initial_splitter import InitialSplitter
+from .lru_cache import CacheStatistics, LRUCache
+
+
+@attr.s(auto_attribs=True)
+class _CachedSimplifications:
+    """
+    Simplifications of a name computed so far, for the cache of NameSimplifier.
+
+    Attributes:
+        stages: simplifications computed so far, in order.
+        complete: whether all the simplifications have been computed.
+        remaining: iterator over the next simplifications, None if it must be
+            created again (f.i. after unpickling).
+    """
+    stages: List[Tuple[str, ...]] = attr.Factory(list)
+    complete: bool = False
+    remaining: Optional[Iterator[List[str]]] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The iterator cannot be pickled; it is created again when needed.
+        return {'stages': self.stages, 'complete': self.complete, 'remaining': None}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
 
 
 class NameSimplifier:
@@ -22,20 +50,136 @@ class NameSimplifier:
 
     This class can produce an iterator over compound names that are simplified more and more, whereby the
     risk of oversimplification increases at every step.
+
+    Optionally, the simplifications are cached for the most recently used names.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 0):
+        """
+        Args:
+            cache_size: number of names for which to keep the simplifications in
+                memory (the least recently used names are discarded first). With 0,
+                nothing is cached.
+        """
         self.initial_splitter = InitialSplitter()
         self.core_name_extractor = CoreNameExtractor()
 
+        self.cache: Optional[LRUCache[str, _CachedSimplifications]] = None
+        if cache_size > 0:
+            self.cache = LRUCache(maxsize=cache_size)
+
     def simplify(self, name: str) -> Generator[List[str], None, None]:
         """
         Returns iterator over simplifications of a given name, without duplication.
 
         The iterator is over a list of strings, since the original compound name may contain several
         different compounds.
+
+        With caching, the simplifications are still computed lazily: the cache keeps
+        the ones computed so far, even if the iterator is not consumed entirely (f.i.
+        when stopping at the first name found in a database), and the next ones are
+        computed only if a later call gets to them.
         """
+        if self.cache is None:
+            yield from self._simplify_without_cache(name)
+            return
+
+        cached = self.cache.get(name)
+        if cached is None:
+            cached = _CachedSimplifications()
+            self.cache.put(name, cached)
+        elif cached.complete:
+            for stage in cached.stages:
+                yield list(stage)
+            return
+
+        index = 0
+        while True:
+            if index < len(cached.stages):
+                yield list(cached.stages[index])
+                index += 1
+                continue
+            if cached.complete:
+                return
+
+            if cached.remaining is None:
+                # Resume after the simplifications computed already
+                cached.remaining = islice(
+                    self._simplify_without_cache(name), len(cached.stages), None
+                )
+            simplified_name = next(cached.remaining, None)
+            if simplified_name is None:
+                cached.complete = True
+                cached.remaining = None
+                return
+            cached.stages.append(tuple(simplified_name))
+
+    def resolve(self, name: str, predicate: Callable[[str], bool]) -> Optional[List[str]]:
+        """
+        Simplifies a name until all its parts are valid.
+
+        Contrary to simplify(), the simplification stages are evaluated for each part
+        of the name independently, and a part is not simplified any further (stripped
+        or split) as soon as it is valid. The evaluation stops at the first part that
+        cannot be made valid.
+
+        Args:
+            name: compound name to simplify.
+            predicate: function determining whether a (simplified) name is valid,
+                f.i. whether it is present in a SMILES database.
+
+        Returns:
+            The valid simplified names, or None if some part of the name could not be
+            simplified to a valid name.
+        """
+        validity: Dict[str, bool] = {}
+
+        def is_valid(candidate: str) -> bool:
+            if candidate not in validity:
+                validity[candidate] = predicate(candidate)
+            return validity[candidate]
+
+        if is_valid(name):
+            return [name]
+
+        resolved_names: List[str] = []
+        with profiling.stage('name_simplifier.initial_split'):
+            parts = self.initial_splitter.split(name)
+        for part in parts:
+            resolved_part = self._resolve_part(part, is_valid)
+            if resolved_part is None:
+                return None
+            resolved_names.extend(resolved_part)
+        return resolved_names
+
+    def _resolve_part(self, part: str, is_valid: Callable[[str], bool]) -> Optional[List[str]]:
+        # Empty names are ignored, as in simplify()
+        if not part:
+            return []
+        if is_valid(part):
+            return [part]
+
+        with profiling.stage('name_simplifier.strip'):
+            stripped_part = self.core_name_extractor.strip_compound(part)
+        if not stripped_part:
+            return []
+        if is_valid(stripped_part):
+            return [stripped_part]
+
+        with profiling.stage('name_simplifier.split'):
+            splits = self.core_name_extractor.split_stripped_compound(stripped_part)
+        splits = [split for split in splits if split]
+        if all(is_valid(split) for split in splits):
+            return splits
+        return None
+
+    def cache_statistics(self) -> Optional[CacheStatistics]:
+        """Usage statistics of the cache, None if caching is disabled."""
+        if self.cache is None:
+            return None
+        return self.cache.statistics()
 
+    def _simplify_without_cache(self, name: str) -> Generator[List[str], None, None]:
         seen: Set[Tuple[str, ...]] = set()
 
         for simplified_name in self._simplify_with_potential_repetition(name):
@@ -50,16 +194,19 @@ class NameSimplifier:
         yield [name]
 
         # name after initial splitting
-        initial_splits = self.initial_splitter.split(name)
+        with profiling.stage('name_simplifier.initial_split'):
+            initial_splits = self.initial_splitter.split(name)
         yield initial_splits
 
         # strip each one of them
-        stripped_names = [self.core_name_extractor.strip_compound(n) for n in initial_splits]
+        with profiling.stage('name_simplifier.strip'):
+            stripped_names = [self.core_name_extractor.strip_compound(n) for n in initial_splits]
         yield stripped_names
 
         # Try to split them
-        stripped_compound_splits = [
-            split for stripped_name in stripped_names
-            for split in self.core_name_extractor.split_stripped_compound(stripped_name)
-        ]
+        with profiling.stage('name_simplifier.split'):
+            stripped_compound_splits = [
+                split for stripped_name in stripped_names
+                for split in self.core_name_extractor.split_stripped_compound(stripped_name)
+            ]
         yield stripped_compound_splits
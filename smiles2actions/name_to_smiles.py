@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional
 
 
 class NameToSmilesError(ValueError):
@@ -27,12 +28,32 @@ class NameToSmiles(ABC):
             SMILES string corresponding to the given name.
         """
 
+    def try_get_smiles(self, name: str) -> Optional[str]:
+        """
+        Get the SMILES string corresponding to a given name, without raising.
+
+        The base class implementation calls get_smiles and catches the
+        potential exception.
+        Derived classes should override this if a missing SMILES string can
+        be determined without exception.
+
+        Args:
+            name: compound name.
+
+        Returns:
+            SMILES string corresponding to the given name, None if no SMILES
+            string can be determined.
+        """
+        try:
+            return self.get_smiles(name)
+        except NameToSmilesError:
+            return None
+
     def has_smiles(self, name: str) -> bool:
         """
         Whether a name has a corresponding SMILES.
 
-        The base class implementation calls get_smiles and catches the
-        potential exception to determine this.
+        The base class implementation relies on try_get_smiles to determine this.
         Derived classes can override this behavior if needed.
 
         Args:
@@ -41,8 +62,27 @@ class NameToSmiles(ABC):
         Returns:
             Whether a SMILES string is available.
         """
-        try:
-            self.get_smiles(name)
-            return True
-        except NameToSmilesError:
-            return False
+        return self.try_get_smiles(name) is not None
+
+    def get_smiles_many(self, names: Iterable[str]) -> Dict[str, str]:
+        """
+        Get the SMILES strings corresponding to several names.
+
+        The base class implementation calls try_get_smiles for every name.
+        Derived classes supporting bulk lookups (f.i. in one database query)
+        should override this, and look up the names with the same normalized
+        name only once.
+
+        Args:
+            names: compound names. May contain duplicates.
+
+        Returns:
+            Dictionary from the names to their SMILES strings. The names
+            without SMILES string are not included.
+        """
+        smiles: Dict[str, str] = {}
+        for name in dict.fromkeys(names):  # removes the duplicates
+            value = self.try_get_smiles(name)
+            if value is not None:
+                smiles[name] = value
+        return smiles
@@ -0,0 +1,82 @@
+import os
+from typing import List, Sequence, Union
+
+import attr
+
+
+@attr.s(auto_attribs=True)
+class TranslationCandidate:
+    """One of the n best translations for a source sequence."""
+    text: str
+    score: float
+
+
+class OnmtTranslator:
+    """
+    Translation of tokenized sequences with a trained OpenNMT-py model.
+
+    The model is loaded once, when the instance is created; the sequences
+    given to translate() are processed with beam search, in one batch.
+
+    Written against the API of OpenNMT-py 1.2.0 (the version in requirements.txt),
+    but not tested against a trained model yet.
+    """
+
+    def __init__(
+        self,
+        model: Union[str, Sequence[str]],
+        beam_size: int = 10,
+        n_best: int = 1,
+        max_length: int = 400,
+        gpu: int = -1,
+    ):
+        """
+        Args:
+            model: path to the translation model; several paths for an ensemble.
+            beam_size: beam size for the beam search.
+            n_best: number of translations to return per sequence.
+            max_length: maximal length of the translations, in tokens.
+            gpu: index of the GPU to run on; -1 for CPU.
+        """
+        # Imported here, so that the rest of the package does not depend on OpenNMT-py and torch
+        from onmt.opts import config_opts, translate_opts
+        from onmt.translate.translator import build_translator
+        from onmt.utils.parse import ArgumentParser
+
+        if n_best > beam_size:
+            raise ValueError(f'n_best ({n_best}) must not exceed beam_size ({beam_size})')
+
+        models = [model] if isinstance(model, str) else list(model)
+        parser = ArgumentParser()
+        config_opts(parser)
+        translate_opts(parser)
+        # "-src" is required by the parser, but not used: the sequences are given to translate()
+        opt = parser.parse_args(
+            ['-model', *models, '-src', 'unused', '-beam_size', str(beam_size), '-n_best',
+             str(n_best), '-max_length', str(max_length), '-gpu', str(gpu)]
+        )
+        ArgumentParser.validate_translate_opts(opt)
+
+        self.n_best = n_best
+        # The translator writes the predictions to a file; they are not needed there
+        self._output = open(os.devnull, 'wt')
+        self._translator = build_translator(opt, report_score=False, out_file=self._output)
+
+    def translate(self, sequences: List[str]) -> List[List[TranslationCandidate]]:
+        """
+        Translate tokenized sequences.
+
+        Returns:
+            For each sequence, its n best translations, from the most to the least likely.
+        """
+        if not sequences:
+            return []
+        scores, predictions = self._translator.translate(
+            src=sequences, batch_size=len(sequences), batch_type='sents'
+        )
+        return [
+            [
+                TranslationCandidate(text=text, score=float(score))
+                for text, score in zip(sequence_predictions, sequence_scores)
+            ] for sequence_predictions, sequence_scores in zip(predictions, scores)
+        ]
@@ -1,3 +1,6 @@
+from typing import Dict
+
+
 class InvalidPlaceholder(ValueError):
 
     def __init__(self, name: str):
@@ -31,9 +34,16 @@ class PlaceholderHandler:
         self.default_prefix = default_affix
         self.default_postfix = default_affix
 
+        # Placeholders already formatted, per index
+        self._placeholders: Dict[int, str] = {}
+
     def to_placeholder(self, index: int) -> str:
         """Converts a given index to a placeholder."""
-        return self.default_prefix + str(index) + self.default_postfix
+        placeholder = self._placeholders.get(index)
+        if placeholder is None:
+            placeholder = self.default_prefix + str(index) + self.default_postfix
+            self._placeholders[index] = placeholder
+        return placeholder
 
     @classmethod
     def for_compounds(cls) -> 'PlaceholderHandler':
@@ -0,0 +1,198 @@
+"""
+Opt-in instrumentation of the processing pipelines.
+
+The instrumented code reports the time spent in its stages (with the
+stage() context manager or the profiled() decorator), events such as
+cache hits (with count()), and the failures per exception type. When
+profiling is disabled (the default), the hooks do nothing.
+
+Profiling is enabled with enable(), or by setting the environment variable
+SMILES2ACTIONS_PROFILING to 1. The statistics are per process; for
+parallel processing, they must be collected in each worker.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TypeVar, Union
+
+import attr
+
+PROFILING_ENV_VARIABLE = 'SMILES2ACTIONS_PROFILING'
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+@attr.s(auto_attribs=True)
+class StageStatistics:
+    """Statistics for one instrumented stage."""
+    calls: int = 0
+    seconds: float = 0.0
+    failures: Counter = attr.Factory(Counter)
+
+
+class Profiler:
+    """Collects the statistics reported by the instrumentation hooks."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.stages: Dict[str, StageStatistics] = {}
+        self.counters: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record_stage(self, name: str, seconds: float, exception: Optional[BaseException]) -> None:
+        with self._lock:
+            statistics = self.stages.get(name)
+            if statistics is None:
+                statistics = self.stages[name] = StageStatistics()
+            statistics.calls += 1
+            statistics.seconds += seconds
+            if exception is not None:
+                statistics.failures[type(exception).__name__] += 1
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += n
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stages.clear()
+            self.counters.clear()
+
+    def report(self) -> Dict[str, Any]:
+        """Get the statistics as a JSON-serializable dictionary."""
+        with self._lock:
+            return {
+                'stages':
+                    {
+                        name: {
+                            'calls': s.calls,
+                            'seconds': s.seconds,
+                            'failures': dict(s.failures)
+                        }
+                        for name, s in sorted(self.stages.items())
+                    },
+                'counters': dict(sorted(self.counters.items())),
+            }
+
+    def to_json(self, filename: Union[Path, str]) -> None:
+        with open(str(filename), 'wt') as f:
+            json.dump(self.report(), f, indent=2)
+
+    def to_prometheus(self, filename: Union[Path, str], prefix: str = 'smiles2actions') -> None:
+        """Write the statistics in the Prometheus text exposition format."""
+        report = self.report()
+        lines = []
+
+        def add_metric(name: str, help_text: str, samples: Dict[str, float]) -> None:
+            lines.append(f'# HELP {prefix}_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            for labels, value in samples.items():
+                lines.append(f'{prefix}_{name}{{{labels}}} {value}')
+
+        stages = report['stages']
+        add_metric(
+            'stage_seconds_total', 'Wall time spent in the stage.',
+            {f'stage="{_escape(name)}"': s['seconds']
+             for name, s in stages.items()}
+        )
+        add_metric(
+            'stage_calls_total', 'Number of executions of the stage.',
+            {f'stage="{_escape(name)}"': s['calls']
+             for name, s in stages.items()}
+        )
+        add_metric(
+            'stage_failures_total', 'Number of failures of the stage, per exception type.', {
+                f'stage="{_escape(name)}",exception="{_escape(exception)}"': n
+                for name, s in stages.items() for exception, n in s['failures'].items()
+            }
+        )
+        add_metric(
+            'events_total', 'Number of occurrences of the event.',
+            {f'event="{_escape(name)}"': n
+             for name, n in report['counters'].items()}
+        )
+
+        with open(str(filename), 'wt') as f:
+            f.write('\n'.join(lines) + '\n')
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class _StageTimer:
+    """Context manager timing a stage."""
+
+    def __init__(self, profiler: Profiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> '_StageTimer':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Optional[BaseException], traceback: Any) -> bool:
+        self.profiler.record_stage(self.name, time.perf_counter() - self.start, exc_value)
+        return False
+
+
+class _NoOpContext:
+    """Context manager used when profiling is disabled."""
+
+    def __enter__(self) -> '_NoOpContext':
+        return self
+
+    def __exit__(self, *args: Any) -> bool:
+        return False
+
+
+_no_op_context = _NoOpContext()
+_profiler = Profiler(enabled=os.environ.get(PROFILING_ENV_VARIABLE, '') == '1')
+
+
+def get_profiler() -> Profiler:
+    """Get the profiler collecting the statistics of the current process."""
+    return _profiler
+
+
+def enable() -> None:
+    _profiler.enabled = True
+
+
+def disable() -> None:
+    _profiler.enabled = False
+
+
+def stage(name: str) -> Union[_StageTimer, _NoOpContext]:
+    """Context manager for timing a stage; does nothing if profiling is disabled."""
+    if not _profiler.enabled:
+        return _no_op_context
+    return _StageTimer(_profiler, name)
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """Decorator for timing a function as a stage; does nothing if profiling is disabled."""
+
+    def decorator(fn: F) -> F:
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _profiler.enabled:
+                return fn(*args, **kwargs)
+            with _StageTimer(_profiler, name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def count(name: str, n: int = 1) -> None:
+    """Count an event; does nothing if profiling is disabled."""
+    if _profiler.enabled:
+        _profiler.count(name, n)
@@ -0,0 +1,107 @@
+"""
+Fast parsing of the canonical forms of temperatures and durations.
+
+Most strings to parse are of the form "<number> <unit>" (such as "25 °C", "2 h",
+"10 min") or "<number>-<number> <unit>" (such as "40-50 °C"). Parsing them with
+quantulum is unnecessarily slow; the functions in this module parse them with
+a single regex and a lookup table, giving the same results as quantulum
+would (including its idiosyncrasies, such as "minutes" corresponding to the
+minute of arc).
+"""
+import re
+from typing import Dict, Optional, Tuple
+
+from ..regex_utils import alternation
+
+# Unit strings, with the unit and entity names they correspond to in quantulum.
+_units: Dict[str, Tuple[str, str]] = {
+    '°C': ('degree_Celsius', 'temperature'),
+    '°F': ('degree_fahrenheit', 'temperature'),
+    'K': ('kelvin', 'temperature'),
+    'C': ('coulomb', 'charge'),
+    'F': ('farad', 'capacitance'),
+    '°': ('degree_angle', 'angle'),
+    'degrees': ('degree_angle', 'angle'),
+    'ms': ('millisecond', 'time'),
+    'min': ('minute', 'time'),
+    'min.': ('minute', 'time'),
+    'minute': ('minute_of_arc', 'angle'),
+    'minutes': ('minute_of_arc', 'angle'),
+    'h': ('hour', 'time'),
+    'h.': ('hour', 'time'),
+    'hr': ('hour', 'time'),
+    'hour': ('hour', 'time'),
+    'hours': ('hour', 'time'),
+    'hours.': ('hour', 'time'),
+    'd': ('day', 'time'),
+    'day': ('day', 'time'),
+    'days': ('day', 'time'),
+    'week': ('week', 'time'),
+    'weeks': ('week', 'time'),
+    'month': ('month', 'time'),
+    'months': ('month', 'time'),
+    'year': ('year', 'time'),
+    'years': ('year', 'time'),
+}
+
+# Unit strings that quantulum interprets differently when they directly follow
+# the number (for instance "2hrs" is parsed as hour times second).
+_units_requiring_space: Dict[str, Tuple[str, str]] = {
+    'hrs': ('hour', 'time'),
+    'mins': ('minute', 'time'),
+    's': ('second', 'time'),
+    'sec': ('second', 'time'),
+    'second': ('second_of_arc', 'angle'),
+    'seconds': ('second_of_arc', 'angle'),
+}
+
+_all_units = {**_units, **_units_requiring_space}
+
+# No leading zeros, no exponents, etc.
+_number = r'(?:0|[1-9][0-9]*)(?:\.[0-9]+)?'
+
+# quantulum only gives the average for ranges with non-negative values
+_range_separator = alternation(['-', '–', ' - ', ' – ', '- ', ' -'])
+
+
+def _unit_alternation(units: Dict[str, Tuple[str, str]]) -> str:
+    # longest first, for the alternation to prefer "min." over "min"
+    return alternation(re.escape(u) for u in sorted(units, key=len, reverse=True))
+
+
+_canonical_vue_regex = re.compile(
+    fr'(?:(?P<value>-?{_number})|(?P<low>{_number}){_range_separator}(?P<high>{_number}))'
+    fr'(?: (?P<spaced_unit>{_unit_alternation(_all_units)})'
+    fr'|(?P<unit>{_unit_alternation(_units)}))'
+)
+
+
+def parse_canonical_vue(text: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Parse a string given in a canonical form.
+
+    Args:
+        text: string to parse, where the special characters have already been normalized.
+
+    Returns:
+        Tuple (value, unit, entity) corresponding to the VUE that quantulum would
+        give for this string, or None if the string is not in one of the canonical forms.
+    """
+    match = _canonical_vue_regex.fullmatch(text)
+    if match is None:
+        return None
+
+    value = match.group('value')
+    if value is not None:
+        float_value = float(value)
+    else:
+        low = float(match.group('low'))
+        high = float(match.group('high'))
+        # quantulum does not detect a range when the values are in the wrong order
+        if low > high:
+            return None
+        float_value = (low + high) / 2
+
+    unit = match.group('spaced_unit') or match.group('unit')
+    unit_name, entity = _all_units[unit]
+    return str(float_value), unit_name, entity
@@ -1,5 +1,5 @@
 import math
-from typing import Optional, List
+from typing import Iterable, Optional, List, Sequence
 
 from pint import Quantity
 
@@ -46,3 +46,16 @@ class DurationPlaceholder:
     def quantity_to_placeholder(self, quantity: Quantity) -> str:
         bin_index = self.quantity_binner.get_bin_index(quantity)
         return self.placeholder_handler.to_placeholder(bin_index + 1)
+
+    def to_placeholders(self, durations: Iterable[str]) -> List[str]:
+        """
+        Convert several durations to placeholders.
+
+        The durations are parsed one by one, but binned all at once.
+        """
+        quantities = [self.duration_extractor.extract_duration(duration).value for duration in durations]
+        return self.quantities_to_placeholders(quantities)
+
+    def quantities_to_placeholders(self, quantities: Sequence[Quantity]) -> List[str]:
+        bin_indices = self.quantity_binner.digitize_quantities(quantities)
+        return [self.placeholder_handler.to_placeholder(int(i) + 1) for i in bin_indices]
@@ -0,0 +1,105 @@
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Union
+
+from .duration_placeholder import DurationPlaceholder
+from .temperature_placeholder import TemperaturePlaceholder
+from ..lru_cache import LRUCache
+from ..utils import iterate_tsv_pairs
+
+
+class PlaceholderResolver:
+    """
+    Converts strings (temperatures, durations) to placeholders with a lookup
+    table, falling back to the full conversion for the strings not in the table.
+
+    The table can be precomputed from a corpus and saved to disk. It is only
+    valid for the binning intervals it was computed with.
+    The results of the fallback conversion are kept in an LRU cache.
+    """
+
+    def __init__(
+        self,
+        to_placeholder_fn: Callable[[str], str],
+        table: Optional[Dict[str, str]] = None,
+        cache_size: int = 100000
+    ):
+        """
+        Args:
+            to_placeholder_fn: full conversion from a string to a placeholder,
+                f.i. TemperaturePlaceholder().to_placeholder.
+            table: precomputed placeholders for the strings.
+            cache_size: number of placeholders obtained with the full
+                conversion to keep in memory. With 0, nothing is cached.
+        """
+        self.to_placeholder_fn = to_placeholder_fn
+        self.table: Dict[str, str] = {} if table is None else dict(table)
+        self.cache: LRUCache[str, str] = LRUCache(maxsize=cache_size)
+
+    @classmethod
+    def for_temperatures(
+        cls, table_file: Optional[Union[Path, str]] = None
+    ) -> 'PlaceholderResolver':
+        resolver = cls(TemperaturePlaceholder().to_placeholder)
+        if table_file is not None:
+            resolver.load(table_file)
+        return resolver
+
+    @classmethod
+    def for_durations(cls, table_file: Optional[Union[Path, str]] = None) -> 'PlaceholderResolver':
+        resolver = cls(DurationPlaceholder().to_placeholder)
+        if table_file is not None:
+            resolver.load(table_file)
+        return resolver
+
+    def to_placeholder(self, text: str) -> str:
+        """
+        Raises:
+            The exceptions of the full conversion, for the strings not in the
+            table that cannot be converted.
+        """
+        placeholder = self.table.get(text)
+        if placeholder is not None:
+            return placeholder
+
+        placeholder = self.cache.get(text)
+        if placeholder is None:
+            placeholder = self.to_placeholder_fn(text)
+            self.cache.put(text, placeholder)
+        return placeholder
+
+    def add_to_table(self, texts: Iterable[str]) -> int:
+        """
+        Precompute the placeholders for the given strings and add them to the table.
+
+        The strings that cannot be converted are ignored.
+
+        Returns:
+            The number of strings added to the table.
+        """
+        number_added = 0
+        for text in texts:
+            if text in self.table:
+                continue
+            try:
+                self.table[text] = self.to_placeholder_fn(text)
+                number_added += 1
+            except ValueError:
+                continue
+        return number_added
+
+    def save(self, filename: Union[Path, str]) -> None:
+        """
+        Save the table to a TSV file.
+
+        The strings that cannot be read back (containing tabs or line breaks, or
+        with leading or trailing whitespace) are omitted.
+        """
+        with open(str(filename), 'wt') as f:
+            for text, placeholder in self.table.items():
+                if '\t' in text or '\n' in text or text != text.strip():
+                    continue
+                f.write(f'{text}\t{placeholder}\n')
+
+    def load(self, filename: Union[Path, str]) -> None:
+        """Add the entries of a TSV file written with save() to the table."""
+        self.table.update(iterate_tsv_pairs(filename))
@@ -1,13 +1,87 @@
+import os
+import pickle
 import re
+from typing import Optional
 
 import pint
 
 from ..regex_utils import alternation
 from ..utils import dash_characters
 
+# Environment variable pointing to a file for caching the unit registry on disk
+UNIT_REGISTRY_CACHE_ENV_VARIABLE = 'SMILES2ACTIONS_UNIT_REGISTRY_CACHE'
+
+_unit_registry: Optional[pint.UnitRegistry] = None
+
+
+class _DiskCachedUnitRegistry(pint.UnitRegistry):
+    """
+    Unit registry that loads its cache of dimensionalities and root units
+    from a pickle file instead of recomputing it, which is the most
+    expensive part of the registry construction.
+
+    The pickle file is created on first use if it does not exist yet.
+    """
+
+    def __init__(self, cache_file: str, **kwargs):
+        self._cache_file = cache_file
+        super().__init__(**kwargs)
+
+    def _build_cache(self) -> None:
+        cache = self._load_cache()
+        if cache is None:
+            super()._build_cache()
+            self._save_cache()
+            return
+
+        # same as what pint.UnitRegistry._build_cache does after computing the cache
+        self._cache = cache
+        self._caches[()] = self._cache
+
+    def _load_cache(self) -> Optional[pint.registry.RegistryCache]:
+        try:
+            with open(self._cache_file, 'rb') as f:
+                pint_version, cache = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError):
+            return None
+
+        # The cache is only valid for the pint version it was created with
+        if pint_version != pint.__version__:
+            return None
+        return cache
+
+    def _save_cache(self) -> None:
+        try:
+            with open(self._cache_file, 'wb') as f:
+                pickle.dump((pint.__version__, self._cache), f)
+        except OSError:
+            # Not being able to write the cache is not critical
+            pass
+
 
 def get_unit_registry() -> pint.UnitRegistry:
-    return pint.UnitRegistry()
+    """
+    Get the unit registry shared by the whole process.
+
+    The registry is built on the first call only. It is also set as the pint
+    application registry, so that quantities created with pint.Quantity
+    are compatible with the ones created from this registry.
+
+    If the environment variable SMILES2ACTIONS_UNIT_REGISTRY_CACHE is set,
+    the registry cache is loaded from the file it points to (and written to
+    it if it does not exist yet).
+    """
+    global _unit_registry
+
+    if _unit_registry is None:
+        cache_file = os.environ.get(UNIT_REGISTRY_CACHE_ENV_VARIABLE)
+        if cache_file:
+            _unit_registry = _DiskCachedUnitRegistry(cache_file=cache_file)
+        else:
+            _unit_registry = pint.UnitRegistry()
+        pint.set_application_registry(_unit_registry)
+
+    return _unit_registry
 
 
 def remove_space_after_initial_dash(text: str) -> str:
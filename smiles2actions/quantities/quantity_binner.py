@@ -1,10 +1,13 @@
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Union
 
 import numpy as np
-from pint import Quantity
+from pint import Quantity, Unit
 
 from paragraph2actions.utils import all_identical
 
+from .quantities_utils import get_unit_registry
+
 
 class BinningError(ValueError):
     """Exception raised for binning errors"""
@@ -40,6 +43,7 @@ class QuantityBinner:
         self.dimensionality = dimensionalities[0]
         self.bin_boundaries = bin_boundaries
         self.unitless_bin_boundaries = [b.to_base_units().magnitude for b in bin_boundaries]
+        self._bin_boundaries_array = np.asarray(self.unitless_bin_boundaries, dtype=float)
 
     def get_bin_index(self, quantity: Quantity) -> int:
         return self.digitize(quantity=quantity)
@@ -56,3 +60,55 @@ class QuantityBinner:
 
         value = quantity.to_base_units().magnitude
         return int(np.digitize(value, self.unitless_bin_boundaries))
+
+    def digitize_many(
+        self,
+        values: Union[Quantity, np.ndarray, Sequence[float]],
+        unit: Optional[Union[Unit, str]] = None
+    ) -> np.ndarray:
+        """
+        Get the bin indices for several values at once.
+
+        The unit conversion happens once for all the values, and the binning
+        is done with one call to numpy.searchsorted.
+
+        Args:
+            values: pint Quantity holding an array, or magnitudes in the given unit.
+            unit: unit of the magnitudes; must be None if values is a Quantity.
+
+        Returns:
+            Array of bin indices, with the same results as calling digitize() for every value.
+        """
+        if isinstance(values, Quantity):
+            if unit is not None:
+                raise ValueError('No unit must be given for a Quantity')
+            quantity = values
+        else:
+            if unit is None:
+                raise ValueError('The unit of the magnitudes must be given')
+            quantity = get_unit_registry().Quantity(np.asarray(values, dtype=float), unit)
+
+        if quantity.dimensionality != self.dimensionality:
+            raise BinningError('Incompatible dimensionality')
+
+        magnitudes = np.asarray(quantity.to_base_units().magnitude, dtype=float)
+        # Same as numpy.digitize for increasing bin boundaries
+        return np.searchsorted(self._bin_boundaries_array, magnitudes, side='right')
+
+    def digitize_quantities(self, quantities: Sequence[Quantity]) -> np.ndarray:
+        """
+        Get the bin indices for several scalar quantities, possibly with
+        different units.
+
+        The quantities are grouped by unit, so that the unit conversion
+        happens once per unit instead of once per quantity.
+        """
+        indices_per_unit: Dict[Unit, List[int]] = defaultdict(list)
+        for index, quantity in enumerate(quantities):
+            indices_per_unit[quantity.units].append(index)
+
+        bin_indices = np.zeros(len(quantities), dtype=int)
+        for unit, indices in indices_per_unit.items():
+            magnitudes = [quantities[i].magnitude for i in indices]
+            bin_indices[indices] = self.digitize_many(magnitudes, unit=unit)
+        return bin_indices
@@ -6,7 +6,10 @@ import regex
 from quantulum3 import parser
 from quantulum3.classes import Quantity
 
+from .canonical_vue_parser import parse_canonical_vue
 from .quantities_utils import remove_space_after_initial_dash
+from .. import profiling
+from ..lru_cache import LRUCache
 from ..regex_utils import alternation, optional
 
 # Without this, quantulum3 has a different behavior depending on the
@@ -65,6 +68,23 @@ manual_check_dict = {
 }
 
 
+# Cache for the results of get_vue and dimensionless_value_from_quantulum.
+# The keys are tuples (function name, input string), the values are None
+# for inputs that could not be parsed.
+_parsing_cache: LRUCache = LRUCache(maxsize=100000)
+_not_cached = object()
+
+
+def get_parsing_cache() -> LRUCache:
+    """
+    Get the cache for the quantity parsing.
+
+    It can be used to look at the statistics, resize the cache, or
+    save it to disk and load it again in later runs.
+    """
+    return _parsing_cache
+
+
 def get_quantulum(text: str) -> Optional[Quantity]:
     qp = parser.parse(text)
     if not qp:
@@ -141,9 +161,46 @@ def get_vue(text: str) -> VUE:
     """
     Returns a list of value, unit and entity extracted from the given text.
     Raises VUEParseError in case of an error
+
+    The results are cached, see get_parsing_cache().
     """
     text = replace_weird_characters(text)
     text = remove_space_after_initial_dash(text)
+
+    key = ('get_vue', text)
+    vue = _parsing_cache.get(key, _not_cached)
+    if vue is _not_cached:
+        profiling.count('quantity_parsing.cache_misses')
+        try:
+            vue = _parse_vue(text)
+        except VUEParseError:
+            vue = None
+        _parsing_cache.put(key, vue)
+    else:
+        profiling.count('quantity_parsing.cache_hits')
+
+    if vue is None:
+        raise VUEParseError
+    # copy, to avoid modifications of the cached instance
+    return attr.evolve(vue)
+
+
+def _parse_vue(text: str) -> VUE:
+    """
+    Implementation of get_vue, for a text where the special characters have
+    already been normalized.
+    """
+    canonical_vue = parse_canonical_vue(text)
+    if canonical_vue is not None:
+        return VUE(*canonical_vue)
+    return _parse_vue_with_quantulum(text)
+
+
+def _parse_vue_with_quantulum(text: str) -> VUE:
+    """
+    Parsing of arbitrary strings, relying on quantulum when the string
+    cannot be interpreted otherwise.
+    """
     special_term = special_terms(text)
     if special_term is not None:
         return special_term
@@ -187,8 +244,16 @@ def dimensionless_value_from_quantulum(text: str) -> float:
     Raises:
         ValueError if the conversion fails
     """
-    qp = get_quantulum(text)
-    if qp is not None and qp.unit.name == 'dimensionless':
-        return qp.value
-
-    raise ValueError(text)
+    key = ('dimensionless_value_from_quantulum', text)
+    value = _parsing_cache.get(key, _not_cached)
+    if value is _not_cached:
+        profiling.count('quantity_parsing.cache_misses')
+        qp = get_quantulum(text)
+        value = qp.value if qp is not None and qp.unit.name == 'dimensionless' else None
+        _parsing_cache.put(key, value)
+    else:
+        profiling.count('quantity_parsing.cache_hits')
+
+    if value is None:
+        raise ValueError(text)
+    return value
@@ -0,0 +1,155 @@
+import sys
+from array import array
+from itertools import accumulate, chain
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .utils import ReactionEquation, split_reaction_string
+
+# Order of the groups of molecules in a reaction
+ROLES = ('reactants', 'agents', 'products')
+_role_indices = {role: index for index, role in enumerate(ROLES)}
+
+
+class ReactionEquationStore:
+    """
+    Compact, columnar storage for a large number of reaction equations.
+
+    Instead of one Python string per molecule, the SMILES strings of all the
+    molecules are concatenated in one string buffer, and located with arrays
+    of offsets:
+    * molecule_offsets: the SMILES of molecule m is buffer[offsets[m]:offsets[m + 1]];
+    * group_offsets: the molecules of reaction i with the role r (0 for the
+      reactants, 1 for the agents, 2 for the products) are the molecules
+      group_offsets[3 * i + r] to group_offsets[3 * i + r + 1] (excluded).
+
+    This takes roughly one byte per character plus 8 bytes per molecule,
+    and the molecules can be accessed individually without creating the
+    ReactionEquation instances.
+    """
+
+    # Number of SMILES strings to merge at once when building the buffer
+    _chunk_size = 100000
+
+    def __init__(self, buffer: str, molecule_offsets: array, group_offsets: array):
+        """
+        Args:
+            buffer: concatenated SMILES strings of all the molecules.
+            molecule_offsets: start of every molecule in the buffer, plus the end of the last one.
+            group_offsets: index of the first molecule for every reaction and role,
+                plus the total number of molecules.
+        """
+        if len(group_offsets) % 3 != 1:
+            raise ValueError(f'Invalid number of group offsets: {len(group_offsets)}')
+        self.buffer = buffer
+        self.molecule_offsets = molecule_offsets
+        self.group_offsets = group_offsets
+
+    @classmethod
+    def from_strings(
+        cls, reaction_strings: Iterable[str], fragment_bond: Optional[str] = None
+    ) -> 'ReactionEquationStore':
+        """
+        Parse "rxn" reaction SMILES, as ReactionEquation.from_string does.
+
+        The input is consumed lazily, and the SMILES strings are merged in
+        chunks, so that the intermediate Python strings do not accumulate.
+
+        Raises:
+            InvalidReactionSmiles for the first string that is not a reaction SMILES.
+        """
+        return cls._from_groups(
+            split_reaction_string(reaction_string, fragment_bond)
+            for reaction_string in reaction_strings
+        )
+
+    @classmethod
+    def from_equations(cls, reaction_equations: Iterable[ReactionEquation]) -> 'ReactionEquationStore':
+        return cls._from_groups(reaction_equations)
+
+    @classmethod
+    def _from_groups(
+        cls, groups_per_reaction: Iterable[Iterable[Tuple[str, ...]]]
+    ) -> 'ReactionEquationStore':
+        chunks: List[str] = []
+        pieces: List[str] = []
+        molecule_offsets = array('q', [0])
+        group_offsets = array('q', [0])
+        number_molecules = 0
+
+        def flush() -> None:
+            # Offsets of the molecules of the chunk, after the end of the previous chunk
+            offsets = accumulate(chain((molecule_offsets[-1], ), map(len, pieces)))
+            next(offsets)
+            molecule_offsets.extend(offsets)
+            chunks.append(''.join(pieces))
+            pieces.clear()
+
+        for groups in groups_per_reaction:
+            for group in groups:
+                pieces.extend(group)
+                number_molecules += len(group)
+                group_offsets.append(number_molecules)
+            if len(pieces) >= cls._chunk_size:
+                flush()
+        flush()
+        return cls(''.join(chunks), molecule_offsets, group_offsets)
+
+    def __len__(self) -> int:
+        return len(self.group_offsets) // 3
+
+    def __getitem__(self, index: int) -> ReactionEquation:
+        """Create the ReactionEquation for one reaction."""
+        group = 3 * self._check_index(index)
+        return ReactionEquation(self._group(group), self._group(group + 1), self._group(group + 2))
+
+    def __iter__(self) -> Iterator[ReactionEquation]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def number_molecules(self, index: int, role: str) -> int:
+        """Number of molecules with a given role ("reactants", "agents", "products") in a reaction."""
+        group = 3 * self._check_index(index) + _role_indices[role]
+        return self.group_offsets[group + 1] - self.group_offsets[group]
+
+    def molecule(self, index: int, role: str, position: int) -> str:
+        """
+        SMILES string of one molecule.
+
+        Args:
+            index: index of the reaction.
+            role: "reactants", "agents", or "products".
+            position: position of the molecule among the ones with this role, starting at 0.
+        """
+        group = 3 * self._check_index(index) + _role_indices[role]
+        start, end = self.group_offsets[group], self.group_offsets[group + 1]
+        if not 0 <= position < end - start:
+            raise IndexError(f'No molecule at position {position} in the {role} of reaction {index}')
+        return self._molecule(start + position)
+
+    def molecules(self, index: int, role: str) -> Tuple[str, ...]:
+        """SMILES strings of the molecules with a given role in a reaction."""
+        return self._group(3 * self._check_index(index) + _role_indices[role])
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by the buffer and the offsets, in bytes."""
+        return (
+            sys.getsizeof(self.buffer) +
+            self.molecule_offsets.itemsize * len(self.molecule_offsets) +
+            self.group_offsets.itemsize * len(self.group_offsets)
+        )
+
+    def _check_index(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(f'Reaction index out of range: {index}')
+        return index
+
+    def _group(self, group: int) -> Tuple[str, ...]:
+        start, end = self.group_offsets[group], self.group_offsets[group + 1]
+        return tuple(self._molecule(m) for m in range(start, end))
+
+    def _molecule(self, molecule_index: int) -> str:
+        return self.buffer[self.molecule_offsets[molecule_index]:self.molecule_offsets[molecule_index + 1]]
@@ -0,0 +1,110 @@
+import argparse
+import functools
+import json
+import os
+from typing import Optional
+
+from ..dataset_builder import DatasetSampleProcessor, build_dataset
+from ..dict_based_name_to_smiles import DictBasedNameToSmiles
+from ..name_normalizer import NameNormalizer
+from ..utils import iterate_tsv_pairs, load_list_from_file
+
+
+def create_processor(
+    names_to_smiles_file: str,
+    admissible_reagents_file: Optional[str],
+    fragment_bond: str,
+    temperature_table_file: Optional[str] = None,
+    duration_table_file: Optional[str] = None
+) -> DatasetSampleProcessor:
+    name_to_smiles = DictBasedNameToSmiles(
+        dict(iterate_tsv_pairs(names_to_smiles_file)),
+        normalize_fn=NameNormalizer.default_normalizer(),
+        # Each worker process has its own instance, used by one thread only
+        normalization_cache_size=100000
+    )
+    admissible_reagents = []
+    if admissible_reagents_file is not None:
+        admissible_reagents = load_list_from_file(admissible_reagents_file)
+    processor = DatasetSampleProcessor(
+        name_to_smiles=name_to_smiles,
+        admissible_reagents=admissible_reagents,
+        fragment_bond=fragment_bond
+    )
+    if temperature_table_file is not None:
+        processor.refiner.temperature_resolver.load(temperature_table_file)
+    if duration_table_file is not None:
+        processor.refiner.duration_resolver.load(duration_table_file)
+    return processor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Build the src/tgt files for training the SMILES-to-actions model.'
+    )
+    parser.add_argument(
+        '--input',
+        required=True,
+        help='TSV file with the reaction SMILES in the first column and the actions in the second one.'
+    )
+    parser.add_argument(
+        '--names_to_smiles',
+        required=True,
+        help='TSV file with compound names in the first column and SMILES in the second one.'
+    )
+    parser.add_argument(
+        '--admissible_reagents',
+        help='File with the compound names (one per line) that can remain in the actions.'
+    )
+    parser.add_argument(
+        '--temperature_table',
+        help='Precomputed temperature placeholders, from smiles2actions-build-placeholder-table.'
+    )
+    parser.add_argument(
+        '--duration_table',
+        help='Precomputed duration placeholders, from smiles2actions-build-placeholder-table.'
+    )
+    parser.add_argument('--output_dir', required=True, help='Where to write the files.')
+    parser.add_argument('--split', default='train', help='Suffix for the files (train, valid, test).')
+    parser.add_argument('--fragment_bond', default='~', help='Fragment bond in the reaction SMILES.')
+    parser.add_argument(
+        '--n_jobs', type=int, default=os.cpu_count(), help='Number of worker processes.'
+    )
+    parser.add_argument(
+        '--chunksize', type=int, default=256, help='Number of samples sent to a worker at once.'
+    )
+    args = parser.parse_args()
+
+    processor_factory = functools.partial(
+        create_processor,
+        names_to_smiles_file=args.names_to_smiles,
+        admissible_reagents_file=args.admissible_reagents,
+        fragment_bond=args.fragment_bond,
+        temperature_table_file=args.temperature_table,
+        duration_table_file=args.duration_table
+    )
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    src_path = os.path.join(args.output_dir, f'src-{args.split}.txt')
+    tgt_path = os.path.join(args.output_dir, f'tgt-{args.split}.txt')
+    counts_path = os.path.join(args.output_dir, f'counts-{args.split}.json')
+
+    with open(src_path, 'wt') as src_file, open(tgt_path, 'wt') as tgt_file:
+        counts = build_dataset(
+            iterate_tsv_pairs(args.input),
+            processor_factory=processor_factory,
+            src_file=src_file,
+            tgt_file=tgt_file,
+            n_jobs=args.n_jobs,
+            chunksize=args.chunksize
+        )
+
+    with open(counts_path, 'wt') as f:
+        json.dump(dict(counts.most_common()), f, indent=2)
+
+    for reason, count in counts.most_common():
+        print(f'{reason}: {count}')
+
+
+if __name__ == '__main__':
+    main()
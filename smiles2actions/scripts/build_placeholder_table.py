@@ -0,0 +1,35 @@
+import argparse
+
+from ..quantities.placeholder_resolver import PlaceholderResolver
+from ..utils import iterate_lines_from_file
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Precompute the placeholders for temperature or duration strings.'
+    )
+    parser.add_argument('--kind', required=True, choices=['temperature', 'duration'])
+    parser.add_argument(
+        '--input', required=True, help='File with the strings to convert, one per line.'
+    )
+    parser.add_argument('--output', required=True, help='Where to write the table (TSV).')
+    parser.add_argument(
+        '--extend', action='store_true', help='Add to the entries already present in the output file.'
+    )
+    args = parser.parse_args()
+
+    if args.kind == 'temperature':
+        resolver = PlaceholderResolver.for_temperatures()
+    else:
+        resolver = PlaceholderResolver.for_durations()
+
+    if args.extend:
+        resolver.load(args.output)
+
+    number_added = resolver.add_to_table(iterate_lines_from_file(args.input))
+    resolver.save(args.output)
+    print(f'Added {number_added} entries; the table contains {len(resolver.table)} entries.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,213 @@
+import argparse
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+import attr
+
+from ..action_predictor import ActionPrediction, ActionPredictor
+from ..cached_action_predictor import CachedActionPredictor
+from ..dynamic_batcher import DynamicBatcher
+from ..onmt_translator import OnmtTranslator
+
+
+class PredictionServer(ThreadingHTTPServer):
+    """
+    HTTP server for the action predictions.
+
+    Every request is handled in its own thread; the reactions of concurrent
+    requests are translated together, in batches given by the DynamicBatcher.
+    Optionally, the predictions are cached (see CachedActionPredictor), in
+    which case only the reactions not in the cache go to the batcher.
+
+    Endpoints:
+        POST /predict with a JSON body {"reactions": ["CC(O)=O.OCC>>CC(=O)OCC", ...]};
+            responds with {"predictions": [{"reaction_smiles": ..., "candidates":
+            [{"raw": ..., "actions": ..., "score": ...}, ...]}, ...]}.
+        GET /health
+
+    The request bodies larger than max_request_bytes are rejected (413).
+    """
+
+    daemon_threads = True
+    max_request_bytes = 1024 * 1024
+
+    def __init__(
+        self,
+        address: Any,
+        predictor: ActionPredictor,
+        batcher: DynamicBatcher,
+        cached_predictor: Optional[CachedActionPredictor] = None
+    ):
+        """
+        Args:
+            address: host and port to listen to.
+            predictor: predictor for validating the reactions.
+            batcher: batcher running predictor.predict_many.
+            cached_predictor: caching front end calling predict_with_batcher for the
+                reactions not in the cache; None for no caching.
+        """
+        super().__init__(address, PredictionRequestHandler)
+        self.predictor = predictor
+        self.batcher = batcher
+        self.cached_predictor = cached_predictor
+
+    def predict_with_batcher(self, reactions: List[str]) -> List[ActionPrediction]:
+        futures = [self.batcher.submit(reaction) for reaction in reactions]
+        return [future.result() for future in futures]
+
+    def predict(self, reactions: List[str]) -> List[ActionPrediction]:
+        if self.cached_predictor is not None:
+            return self.cached_predictor.predict_many(reactions)
+        return self.predict_with_batcher(reactions)
+
+
+class PredictionRequestHandler(BaseHTTPRequestHandler):
+    server: PredictionServer
+
+    def do_GET(self) -> None:
+        if self.path != '/health':
+            self._send_json(404, {'error': f'Unknown path: {self.path}'})
+            return
+        self._send_json(200, {'status': 'ok'})
+
+    def do_POST(self) -> None:
+        if self.path != '/predict':
+            self._send_json(404, {'error': f'Unknown path: {self.path}'})
+            return
+
+        length = self._content_length()
+        if length is None:
+            self._send_json(400, {'error': 'Missing or invalid Content-Length'})
+            return
+        if length > self.server.max_request_bytes:
+            self._send_json(
+                413,
+                {'error': f'Request body larger than {self.server.max_request_bytes} bytes'}
+            )
+            return
+
+        try:
+            reactions = self._read_reactions(length)
+            # Validated here, so that an invalid reaction does not make the whole batch fail
+            for reaction in reactions:
+                self.server.predictor.check_reaction_smiles(reaction)
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        try:
+            predictions = self.server.predict(reactions)
+        except Exception as e:
+            self._send_json(500, {'error': f'Prediction failed: {e}'})
+            return
+
+        self._send_json(200, {'predictions': [attr.asdict(p) for p in predictions]})
+
+    def _content_length(self) -> Optional[int]:
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            return None
+        return length if length >= 0 else None
+
+    def _read_reactions(self, length: int) -> List[str]:
+        try:
+            content = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError as e:
+            raise ValueError(f'Invalid JSON: {e}') from e
+
+        reactions = content.get('reactions') if isinstance(content, dict) else None
+        if not isinstance(reactions, list) or not all(isinstance(r, str) for r in reactions):
+            raise ValueError('Expected a JSON object with a list of reaction SMILES as "reactions"')
+        return reactions
+
+    def _send_json(self, status: int, content: Dict[str, Any]) -> None:
+        body = json.dumps(content).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Serve the action predictions of a trained model over HTTP.'
+    )
+    parser.add_argument(
+        '--model', required=True, nargs='+', help='Translation model(s); several for an ensemble.'
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--beam_size', type=int, default=10)
+    parser.add_argument('--n_best', type=int, default=1, help='Number of predictions per reaction.')
+    parser.add_argument('--max_length', type=int, default=400)
+    parser.add_argument('--gpu', type=int, default=-1, help='GPU to run on; -1 for CPU.')
+    parser.add_argument(
+        '--max_batch_size', type=int, default=32, help='Maximal number of reactions per batch.'
+    )
+    parser.add_argument(
+        '--max_latency_ms',
+        type=float,
+        default=50.0,
+        help='Maximal time to wait for more reactions before translating a batch.'
+    )
+    parser.add_argument(
+        '--fragment_bond', default='~', help='Fragment bond in the reaction SMILES.'
+    )
+    parser.add_argument(
+        '--max_request_bytes',
+        type=int,
+        default=PredictionServer.max_request_bytes,
+        help='Maximal size of the request bodies.'
+    )
+    parser.add_argument(
+        '--cache_size',
+        type=int,
+        default=0,
+        help='Number of predictions to cache in memory. With 0 (and no cache file), no caching.'
+    )
+    parser.add_argument(
+        '--cache_file',
+        help='SQLite file for caching the predictions on disk, specific to the model and settings.'
+    )
+    args = parser.parse_args()
+
+    translator = OnmtTranslator(
+        model=args.model,
+        beam_size=args.beam_size,
+        n_best=args.n_best,
+        max_length=args.max_length,
+        gpu=args.gpu
+    )
+    predictor = ActionPredictor(translator, fragment_bond=args.fragment_bond)
+    batcher = DynamicBatcher(
+        predictor.predict_many,
+        max_batch_size=args.max_batch_size,
+        max_latency=args.max_latency_ms / 1000
+    )
+
+    server = PredictionServer((args.host, args.port), predictor, batcher)
+    server.max_request_bytes = args.max_request_bytes
+    if args.cache_size > 0 or args.cache_file is not None:
+        server.cached_predictor = CachedActionPredictor(
+            server.predict_with_batcher,
+            fragment_bond=args.fragment_bond,
+            cache_size=args.cache_size,
+            cache_file=args.cache_file
+        )
+    print(f'Serving on http://{args.host}:{args.port}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.stop()
+        if server.cached_predictor is not None:
+            server.cached_predictor.close()
+
+
+if __name__ == '__main__':
+    main()
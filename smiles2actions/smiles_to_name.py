@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional
 
 
 class SmilesToNameError(ValueError):
@@ -27,12 +28,32 @@ class SmilesToName(ABC):
             Name corresponding to the given SMILES string.
         """
 
+    def try_get_name(self, smiles: str) -> Optional[str]:
+        """
+        Get the name corresponding to a given SMILES string, without raising.
+
+        The base class implementation calls get_name and catches the
+        potential exception.
+        Derived classes should override this if a missing name can be
+        determined without exception.
+
+        Args:
+            smiles: SMILES string.
+
+        Returns:
+            Name corresponding to the given SMILES string, None if no name
+            can be determined.
+        """
+        try:
+            return self.get_name(smiles)
+        except SmilesToNameError:
+            return None
+
     def has_name(self, smiles: str) -> bool:
         """
         Whether a SMILES string has a corresponding name.
 
-        The base class implementation calls get_name and catches the
-        potential exception to determine this.
+        The base class implementation relies on try_get_name to determine this.
         Derived classes can override this behavior if needed.
 
         Args:
@@ -41,8 +62,26 @@ class SmilesToName(ABC):
         Returns:
             Whether a name is available for the given SMILES string.
         """
-        try:
-            self.get_name(smiles)
-            return True
-        except SmilesToNameError:
-            return False
+        return self.try_get_name(smiles) is not None
+
+    def get_name_many(self, smiles_strings: Iterable[str]) -> Dict[str, str]:
+        """
+        Get the names corresponding to several SMILES strings.
+
+        The base class implementation calls try_get_name for every SMILES string.
+        Derived classes supporting bulk lookups (f.i. in one database query)
+        should override this.
+
+        Args:
+            smiles_strings: SMILES strings. May contain duplicates.
+
+        Returns:
+            Dictionary from the SMILES strings to their names. The SMILES
+            strings without name are not included.
+        """
+        names: Dict[str, str] = {}
+        for smiles in dict.fromkeys(smiles_strings):  # removes the duplicates
+            name = self.try_get_name(smiles)
+            if name is not None:
+                names[smiles] = name
+        return names
@@ -0,0 +1,219 @@
+import heapq
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# File layout:
+#   - magic bytes
+#   - number of entries N (unsigned 64-bit integer, little endian)
+#   - N + 1 offsets of the records, relative to the start of the records
+#     (unsigned 64-bit integers, little endian); the last one is the total size
+#   - records "key\tvalue\n" encoded in UTF-8, sorted by key (bytewise)
+_magic = b'S2AKV001'
+_header = struct.Struct('<8sQ')
+_offset = struct.Struct('<Q')
+
+
+class SortedKeyValueFileError(ValueError):
+
+    def __init__(self, filename: str, reason: str):
+        super().__init__(f'Invalid sorted key-value file "{filename}": {reason}.')
+
+
+def build_sorted_key_value_file(
+    pairs: Iterable[Tuple[str, str]],
+    filename: Union[Path, str],
+    key_fn: Optional[Callable[[str], str]] = None,
+    chunk_size: int = 1000000,
+) -> int:
+    """
+    Write key-value pairs to a file that can be queried with SortedKeyValueFile.
+
+    The pairs are sorted in chunks that are merged afterwards, so that the
+    memory usage does not depend on the number of pairs.
+    As for a dictionary built from the pairs, the last value wins for
+    duplicate keys.
+
+    Args:
+        pairs: keys and values. Keys and values containing a tab or a line
+            break are ignored.
+        filename: where to write the file.
+        key_fn: function to apply to the keys before writing them, f.i. for normalization.
+        chunk_size: number of pairs to sort in memory at once.
+
+    Returns:
+        The number of (unique) keys in the file.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        chunk_files = _write_sorted_chunks(pairs, key_fn, chunk_size, tmp_dir)
+
+        records_path = os.path.join(tmp_dir, 'records')
+        offsets = array('Q', [0])
+        with open(records_path, 'wb') as records_file:
+            for record in _merge_sorted_chunks(chunk_files):
+                records_file.write(record)
+                offsets.append(offsets[-1] + len(record))
+
+        if offsets.itemsize != _offset.size:
+            raise RuntimeError('Unsupported platform: unsigned long long is not 64-bit')
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+
+        number_entries = len(offsets) - 1
+        with open(str(filename), 'wb') as f:
+            f.write(_header.pack(_magic, number_entries))
+            offsets.tofile(f)
+            with open(records_path, 'rb') as records_file:
+                shutil.copyfileobj(records_file, f)
+
+    return number_entries
+
+
+def _write_sorted_chunks(
+    pairs: Iterable[Tuple[str, str]], key_fn: Optional[Callable[[str], str]], chunk_size: int,
+    directory: str
+) -> List[str]:
+    """Write the pairs to files in chunks of sorted (key, index, value) tuples."""
+    chunk_files: List[str] = []
+    chunk: List[Tuple[bytes, int, bytes]] = []
+
+    def write_chunk() -> None:
+        chunk.sort()
+        path = os.path.join(directory, f'chunk_{len(chunk_files)}')
+        with open(path, 'wb') as f:
+            for key, index, value in chunk:
+                f.write(b'%s\t%d\t%s\n' % (key, index, value))
+        chunk_files.append(path)
+        chunk.clear()
+
+    for index, (key, value) in enumerate(pairs):
+        if key_fn is not None:
+            key = key_fn(key)
+        if _has_separator(key) or _has_separator(value):
+            continue
+        chunk.append((key.encode('utf-8'), index, value.encode('utf-8')))
+        if len(chunk) >= chunk_size:
+            write_chunk()
+    if chunk:
+        write_chunk()
+
+    return chunk_files
+
+
+def _merge_sorted_chunks(chunk_files: List[str]) -> Iterator[bytes]:
+    """Merge the chunks, and get the records for the last value of every key."""
+    files = [open(path, 'rb') for path in chunk_files]
+    try:
+        chunks = [(_parse_chunk_line(line) for line in f) for f in files]
+        previous: Optional[Tuple[bytes, int, bytes]] = None
+        for entry in heapq.merge(*chunks):
+            if previous is not None and previous[0] != entry[0]:
+                yield previous[0] + b'\t' + previous[2] + b'\n'
+            previous = entry
+        if previous is not None:
+            yield previous[0] + b'\t' + previous[2] + b'\n'
+    finally:
+        for f in files:
+            f.close()
+
+
+def _parse_chunk_line(line: bytes) -> Tuple[bytes, int, bytes]:
+    key, index, value = line[:-1].split(b'\t')
+    return key, int(index), value
+
+
+def _has_separator(s: str) -> bool:
+    return '\t' in s or '\n' in s
+
+
+class SortedKeyValueFile:
+    """
+    Read-only mapping from strings to strings, served from a file written by
+    build_sorted_key_value_file.
+
+    The file is memory-mapped, so that its content is shared between all the
+    processes using it instead of being loaded in each of them. A lookup is a
+    binary search over the sorted keys.
+    """
+
+    def __init__(self, filename: Union[Path, str]):
+        self.filename = str(filename)
+        self._file = open(self.filename, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            # mmap fails for empty files
+            self._file.close()
+            raise SortedKeyValueFileError(self.filename, 'empty file') from e
+
+        if len(self._mmap) < _header.size:
+            self.close()
+            raise SortedKeyValueFileError(self.filename, 'truncated header')
+        magic, self.number_entries = _header.unpack_from(self._mmap, 0)
+        if magic != _magic:
+            self.close()
+            raise SortedKeyValueFileError(self.filename, 'unknown format')
+
+        self._offsets_start = _header.size
+        self._records_start = self._offsets_start + (self.number_entries + 1) * _offset.size
+
+    def __len__(self) -> int:
+        return self.number_entries
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __enter__(self) -> 'SortedKeyValueFile':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the value for a key, None if the key is not present."""
+        encoded_key = key.encode('utf-8')
+        low, high = 0, self.number_entries
+        while low < high:
+            middle = (low + high) // 2
+            record_start, record_end = self._record_bounds(middle)
+            key_end = self._mmap.find(b'\t', record_start, record_end)
+            record_key = self._mmap[record_start:key_end]
+            if record_key < encoded_key:
+                low = middle + 1
+            elif record_key > encoded_key:
+                high = middle
+            else:
+                # the record ends with a line break
+                return self._mmap[key_end + 1:record_end - 1].decode('utf-8')
+        return None
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """Iterate over the keys and values, sorted by key."""
+        for index in range(self.number_entries):
+            record_start, record_end = self._record_bounds(index)
+            record = self._mmap[record_start:record_end - 1].decode('utf-8')
+            key, value = record.split('\t')
+            yield key, value
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+    def _record_bounds(self, index: int) -> Tuple[int, int]:
+        position = self._offsets_start + index * _offset.size
+        start, = _offset.unpack_from(self._mmap, position)
+        end, = _offset.unpack_from(self._mmap, position + _offset.size)
+        return self._records_start + start, self._records_start + end
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The memory map cannot be pickled; it is opened again when unpickling.
+        return {'filename': self.filename}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state['filename'])  # type: ignore
@@ -0,0 +1,220 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .lru_cache import CacheStatistics, LRUCache
+
+# Value stored in the cache for the keys without value in the database
+_no_value = object()
+_not_cached = object()
+
+
+class SqliteMapping:
+    """
+    Persistent mapping from strings to strings, stored in a table of an
+    SQLite file, with the keys as (indexed) primary key.
+
+    Every thread gets its own connection to the database, which stays open
+    until close(); for many short-lived threads (f.i. one per request of a
+    server), the shared_connection mode uses one connection for all the
+    threads instead, guarded by a lock. Lookups for several keys are done with chunked "IN (...)" queries, and the results
+    of the lookups are optionally kept in an LRU cache.
+    """
+
+    # Maximal number of keys per query, below the default limit of SQLite for the number of parameters
+    max_keys_per_query = 500
+
+    def __init__(
+        self,
+        filename: Union[Path, str],
+        table: str,
+        cache_size: int = 0,
+        shared_connection: bool = False
+    ):
+        """
+        Args:
+            filename: SQLite file; created if it does not exist.
+            table: name of the table holding the mapping; created if it does not exist.
+            cache_size: number of lookup results to keep in memory. With 0, nothing is cached.
+            shared_connection: whether all the threads use the same connection,
+                one at a time, instead of one connection per thread.
+        """
+        if not table.isidentifier():
+            raise ValueError(f'Invalid table name: "{table}"')
+
+        self.filename = str(filename)
+        self.table = table
+        self.cache_size = cache_size
+        self.shared_connection = shared_connection
+
+        self._thread_data = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # Held during the queries on the shared connection
+        self._shared_connection_lock = threading.Lock()
+        self._shared_connection: Optional[sqlite3.Connection] = None
+
+        self._cache: LRUCache[str, Any] = LRUCache(maxsize=cache_size)
+        self._cache_lock = threading.Lock()
+
+        with self._locked_connection() as connection, connection:
+            connection.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.table} '
+                f'(key TEXT PRIMARY KEY NOT NULL, value TEXT NOT NULL) WITHOUT ROWID'
+            )
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Get the connection for the current thread.
+
+        In the shared_connection mode, the same connection is returned for all
+        the threads; it must then only be used while holding the lock of
+        _locked_connection.
+        """
+        if self.shared_connection:
+            with self._connections_lock:
+                if self._shared_connection is None:
+                    self._shared_connection = sqlite3.connect(
+                        self.filename, check_same_thread=False
+                    )
+                    self._connections.append(self._shared_connection)
+                return self._shared_connection
+
+        connection = getattr(self._thread_data, 'connection', None)
+        if connection is None:
+            # check_same_thread=False only so that close() can close the
+            # connections of all the threads; a connection is used by one thread only.
+            connection = sqlite3.connect(self.filename, check_same_thread=False)
+            self._thread_data.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def number_connections(self) -> int:
+        """Number of open connections."""
+        with self._connections_lock:
+            return len(self._connections)
+
+    def __len__(self) -> int:
+        with self._locked_connection() as connection:
+            count, = connection.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()
+        return count
+
+    def update(self, pairs: Iterable[Tuple[str, str]], batch_size: int = 100000) -> None:
+        """
+        Insert key-value pairs, replacing the values of existing keys.
+
+        Args:
+            pairs: keys and values.
+            batch_size: number of pairs to insert per transaction.
+        """
+        batch: List[Tuple[str, str]] = []
+        for pair in pairs:
+            batch.append(pair)
+            if len(batch) >= batch_size:
+                self._insert(batch)
+                batch = []
+        if batch:
+            self._insert(batch)
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the value for a key, None if the key is not present."""
+        value = self._get_cached(key)
+        if value is _not_cached:
+            with self._locked_connection() as connection:
+                row = connection.execute(
+                    f'SELECT value FROM {self.table} WHERE key = ?', (key, )
+                ).fetchone()
+            value = _no_value if row is None else row[0]
+            self._put_cached(key, value)
+        return None if value is _no_value else value
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Get the values for several keys.
+
+        Returns:
+            Dictionary from the keys to their values. The keys not present are not included.
+        """
+        values: Dict[str, str] = {}
+        keys_to_query: List[str] = []
+        for key in dict.fromkeys(keys):  # removes the duplicates
+            value = self._get_cached(key)
+            if value is _not_cached:
+                keys_to_query.append(key)
+            elif value is not _no_value:
+                values[key] = value
+
+        for i in range(0, len(keys_to_query), self.max_keys_per_query):
+            chunk = keys_to_query[i:i + self.max_keys_per_query]
+            placeholders = ', '.join('?' * len(chunk))
+            with self._locked_connection() as connection:
+                rows = connection.execute(
+                    f'SELECT key, value FROM {self.table} WHERE key IN ({placeholders})', chunk
+                ).fetchall()
+            queried_values = dict(rows)
+            values.update(queried_values)
+            for key in chunk:
+                self._put_cached(key, queried_values.get(key, _no_value))
+
+        return values
+
+    def cache_statistics(self) -> CacheStatistics:
+        with self._cache_lock:
+            return self._cache.statistics()
+
+    def close(self) -> None:
+        """Close the connections of all the threads."""
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+            self._shared_connection = None
+        self._thread_data = threading.local()
+
+    @contextmanager
+    def _locked_connection(self) -> Iterator[sqlite3.Connection]:
+        """Connection for the current thread, used by this thread only while in the context."""
+        if not self.shared_connection:
+            yield self.connection()
+            return
+        connection = self.connection()
+        with self._shared_connection_lock:
+            yield connection
+
+    def _insert(self, pairs: List[Tuple[str, str]]) -> None:
+        with self._locked_connection() as connection, connection:
+            connection.executemany(
+                f'INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)', pairs
+            )
+        # Keep the cache consistent with the database
+        with self._cache_lock:
+            for key, value in pairs:
+                if key in self._cache:
+                    self._cache.put(key, value)
+
+    def _get_cached(self, key: str) -> Any:
+        if self.cache_size == 0:
+            return _not_cached
+        with self._cache_lock:
+            return self._cache.get(key, _not_cached)
+
+    def _put_cached(self, key: str, value: Any) -> None:
+        if self.cache_size == 0:
+            return
+        with self._cache_lock:
+            self._cache.put(key, value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections and locks cannot be pickled; they are created again when unpickling.
+        return {
+            'filename': self.filename,
+            'table': self.table,
+            'cache_size': self.cache_size,
+            'shared_connection': self.shared_connection,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)  # type: ignore
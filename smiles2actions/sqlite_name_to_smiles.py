@@ -0,0 +1,69 @@
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+
+from .name_to_smiles import NameToSmiles, NameToSmilesError
+from .sqlite_mapping import SqliteMapping
+from .utils import iterate_tsv_pairs
+
+
+class SqliteNameToSmiles(NameToSmiles):
+    """
+    NameToSmiles based on an SQLite file, that can be updated without
+    rebuilding it (see SqliteMapping).
+    """
+
+    def __init__(
+        self,
+        filename: Union[Path, str],
+        normalize_fn: Optional[Callable[[str], str]] = None,
+        cache_size: int = 0
+    ):
+        """
+        Args:
+            filename: SQLite file; created if it does not exist.
+            normalize_fn: normalization function for the names, must be the
+                same every time the file is used.
+            cache_size: number of lookup results to keep in memory. With 0, nothing is cached.
+        """
+        self.mapping = SqliteMapping(filename, table='name_to_smiles', cache_size=cache_size)
+        self.normalize_fn = normalize_fn
+
+    @classmethod
+    def from_tsv(
+        cls,
+        tsv_file: Union[Path, str],
+        filename: Union[Path, str],
+        normalize_fn: Optional[Callable[[str], str]] = None,
+        cache_size: int = 0
+    ) -> 'SqliteNameToSmiles':
+        """
+        Add the content of a TSV file with the names in the first column and
+        the SMILES strings in the second one to the SQLite file, and open it.
+        """
+        name_to_smiles = cls(filename, normalize_fn=normalize_fn, cache_size=cache_size)
+        name_to_smiles.add(iterate_tsv_pairs(tsv_file))
+        return name_to_smiles
+
+    def add(self, names_and_smiles: Iterable[Tuple[str, str]]) -> None:
+        """Add names and their SMILES strings, replacing the existing ones."""
+        self.mapping.update((self._normalize(name), smiles) for name, smiles in names_and_smiles)
+
+    def get_smiles(self, name: str) -> str:
+        key = self._normalize(name)
+        smiles = self.mapping.get(key)
+        if smiles is None:
+            raise NameToSmilesError(key)
+        return smiles
+
+    def try_get_smiles(self, name: str) -> Optional[str]:
+        return self.mapping.get(self._normalize(name))
+
+    def get_smiles_many(self, names: Iterable[str]) -> Dict[str, str]:
+        keys = {name: self._normalize(name) for name in names}
+        smiles = self.mapping.get_many(keys.values())
+        return {name: smiles[key] for name, key in keys.items() if key in smiles}
+
+    def _normalize(self, name: str) -> str:
+        if self.normalize_fn is None:
+            return name
+        return self.normalize_fn(name)
@@ -0,0 +1,49 @@
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from .smiles_to_name import SmilesToName, SmilesToNameError
+from .sqlite_mapping import SqliteMapping
+from .utils import iterate_tsv_pairs
+
+
+class SqliteSmilesToName(SmilesToName):
+    """
+    SmilesToName based on an SQLite file, that can be updated without
+    rebuilding it (see SqliteMapping).
+    """
+
+    def __init__(self, filename: Union[Path, str], cache_size: int = 0):
+        """
+        Args:
+            filename: SQLite file; created if it does not exist.
+            cache_size: number of lookup results to keep in memory. With 0, nothing is cached.
+        """
+        self.mapping = SqliteMapping(filename, table='smiles_to_name', cache_size=cache_size)
+
+    @classmethod
+    def from_tsv(
+        cls, tsv_file: Union[Path, str], filename: Union[Path, str], cache_size: int = 0
+    ) -> 'SqliteSmilesToName':
+        """
+        Add the content of a TSV file with the SMILES strings in the first
+        column and the names in the second one to the SQLite file, and open it.
+        """
+        smiles_to_name = cls(filename, cache_size=cache_size)
+        smiles_to_name.add(iterate_tsv_pairs(tsv_file))
+        return smiles_to_name
+
+    def add(self, smiles_and_names: Iterable[Tuple[str, str]]) -> None:
+        """Add SMILES strings and their names, replacing the existing ones."""
+        self.mapping.update(smiles_and_names)
+
+    def get_name(self, smiles: str) -> str:
+        name = self.mapping.get(smiles)
+        if name is None:
+            raise SmilesToNameError(smiles)
+        return name
+
+    def try_get_name(self, smiles: str) -> Optional[str]:
+        return self.mapping.get(smiles)
+
+    def get_name_many(self, smiles_strings: Iterable[str]) -> Dict[str, str]:
+        return self.mapping.get_many(smiles_strings)
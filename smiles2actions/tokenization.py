@@ -0,0 +1,74 @@
+"""
+Tokenization of (reaction) SMILES strings, in the format of src-*.txt:
+atom-level tokens separated by spaces, with the bracket atoms as single
+tokens, and ">>", ">" and "~" (fragment bond) as tokens of their own.
+
+The tokenization is lossless: detokenize_smiles(tokenize_smiles(smiles))
+gives back the original string. Strings with characters that cannot be
+tokenized (f.i. spaces, or two-letter elements outside of brackets) raise
+a SmilesTokenizationError instead of being silently altered.
+"""
+import re
+from typing import Iterable, Iterator, List
+
+from .utils import detokenize_smiles
+
+# Regex for the tokenization of reaction SMILES, in the format of src-*.txt.
+# The single-character tokens are grouped in one character class, which is
+# faster than separate alternatives; as all the alternatives start with
+# different characters, their order does not matter.
+_smiles_token_regex = re.compile(r'\[[^\]\s]+]|Br?|Cl?|>>?|%[0-9]{2}|[NOSPFIbcnosp().=#\-+\\/:~@?*$0-9]')
+
+
+class SmilesTokenizationError(ValueError):
+
+    def __init__(self, smiles: str):
+        super().__init__(f'Cannot tokenize "{smiles}": it contains invalid characters')
+
+
+def split_smiles(smiles: str) -> List[str]:
+    """
+    Split a (reaction) SMILES string into its tokens.
+
+    Raises:
+        SmilesTokenizationError if some characters are not part of a token.
+    """
+    tokens = _smiles_token_regex.findall(smiles)
+    # The tokens are consecutive, non-overlapping matches: if they cover as
+    # many characters as the string, no character was skipped
+    if sum(map(len, tokens)) != len(smiles):
+        raise SmilesTokenizationError(smiles)
+    return tokens
+
+
+def tokenize_smiles(smiles: str) -> str:
+    """
+    Tokenize a (reaction) SMILES string, in the format of src-*.txt.
+
+    Args:
+        smiles: SMILES string, for instance 'CC(CO)=N>>CC(C=O)N'
+
+    Returns:
+        tokenized SMILES, for instance 'C C ( C O ) = N >> C C ( C = O ) N'
+
+    Raises:
+        SmilesTokenizationError if some characters are not part of a token.
+    """
+    return ' '.join(split_smiles(smiles))
+
+
+def tokenize_smiles_many(smiles_strings: Iterable[str]) -> Iterator[str]:
+    """
+    Tokenize several (reaction) SMILES strings lazily, for instance the lines of a file.
+
+    Raises:
+        SmilesTokenizationError for the first string with characters that are not part of a token.
+    """
+    for smiles in smiles_strings:
+        yield tokenize_smiles(smiles)
+
+
+def detokenize_smiles_many(tokenized_smiles_strings: Iterable[str]) -> Iterator[str]:
+    """Detokenize several tokenized SMILES strings lazily, see detokenize_smiles."""
+    for tokenized_smiles in tokenized_smiles_strings:
+        yield detokenize_smiles(tokenized_smiles)
@@ -1,8 +1,7 @@
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional, Union, Generator
+from typing import Iterable, Iterator, List, Optional, Tuple, Union, Generator
 
 import attr
-import numpy as np
 from paragraph2actions.actions import Action
 from paragraph2actions.utils import extract_chemicals
 
@@ -16,23 +15,38 @@ dash_characters = [
 
 
 def remove_slices_of_string(slices: Iterable[slice], string: str) -> str:
-    """Remove parts of a string"""
-
-    # create mask of which characters to remove
-    remove_index_mask = np.full(len(string), False)
-    for s in slices:
-        remove_index_mask[s] = True
-
-    # convert string to a list
-    lst = list(string)
+    """
+    Remove parts of a string.
 
-    # remove characters
-    for index, remove_index in enumerate(remove_index_mask):
-        if remove_index:
-            lst[index] = ''
+    The slices may be unsorted, overlap, or extend beyond the string; they
+    follow the usual slicing semantics (negative indices, steps).
+    """
+    length = len(string)
 
-    # convert back to a string
-    return ''.join(lst)
+    # spans (start, stop) of the characters to remove
+    spans = []
+    for s in slices:
+        start, stop, step = s.indices(length)
+        if step == 1:
+            if start < stop:
+                spans.append((start, stop))
+        else:
+            spans.extend((i, i + 1) for i in range(start, stop, step))
+
+    if not spans:
+        return string
+    spans.sort()
+
+    # concatenate the substrings in between the merged spans
+    kept_parts = []
+    position = 0
+    for start, stop in spans:
+        if start > position:
+            kept_parts.append(string[position:start])
+        if stop > position:
+            position = stop
+    kept_parts.append(string[position:])
+    return ''.join(kept_parts)
 
 
 def remove_prefix(text: str, prefix: str) -> str:
@@ -59,25 +73,35 @@ def remove_postfix(text: str, postfix: str) -> str:
     return text
 
 
-@attr.s(auto_attribs=True)
+class InvalidReactionSmiles(ValueError):
+
+    def __init__(self, reaction_smiles: str):
+        super().__init__(f'"{reaction_smiles}" is not a valid reaction SMILES')
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class ReactionEquation:
     """
     Defines a reaction equation, as given by the molecules involved in a reaction.
 
+    The instances are immutable (and hashable), and have no instance
+    dictionary; see ReactionEquationStore for holding a large number of
+    reaction equations in little memory.
+
     Attributes:
         reactants: SMILES strings for compounds on the left of the reaction arrow.
         agents: SMILES strings for compounds above the reaction arrow. Are
             sometimes merged with the reactants.
         products: SMILES strings for compounds on the right of the reaction arrow.
     """
-    reactants: List[str]
-    agents: List[str]
-    products: List[str]
+    reactants: Tuple[str, ...] = attr.ib(converter=tuple)
+    agents: Tuple[str, ...] = attr.ib(converter=tuple)
+    products: Tuple[str, ...] = attr.ib(converter=tuple)
 
-    def __iter__(self) -> Iterator[List[str]]:
+    def __iter__(self) -> Iterator[Tuple[str, ...]]:
         """Helper function to simplify functionality acting on all three
         compound groups"""
-        return (i for i in (self.reactants, self.agents, self.products))
+        return iter((self.reactants, self.agents, self.products))
 
     @classmethod
     def from_string(
@@ -85,21 +109,61 @@ class ReactionEquation:
     ) -> 'ReactionEquation':
         """
         Convert a ReactionEquation from an "rxn" reaction SMILES.
+
+        Raises:
+            InvalidReactionSmiles if the string does not contain exactly two ">".
+        """
+        return cls(*split_reaction_string(reaction_string, fragment_bond))
+
+    @classmethod
+    def from_strings(
+        cls, reaction_strings: Iterable[str], fragment_bond: Optional[str] = None
+    ) -> List['ReactionEquation']:
         """
+        Convert several "rxn" reaction SMILES, see from_string.
 
-        smiles_groups = reaction_string.split('>')
+        For a large number of reactions, ReactionEquationStore.from_strings
+        gives a more compact, columnar representation.
 
-        # split the groups
-        groups = [smiles_group.split('.') for smiles_group in smiles_groups]
+        Raises:
+            InvalidReactionSmiles for the first string that is not a reaction SMILES.
+        """
+        return [cls(*split_reaction_string(s, fragment_bond)) for s in reaction_strings]
 
-        # replace [''] by [] (for instance when there are no agents)
-        groups = [group if group != [''] else [] for group in groups]
+    def to_string(self, fragment_bond: Optional[str] = None) -> str:
+        """
+        Convert to an "rxn" reaction SMILES; inverse of from_string.
 
-        # replace fragment bonds if necessary
+        Args:
+            fragment_bond: if given, replaces the dots inside the compounds.
+        """
+        groups = list(self)
         if fragment_bond is not None:
-            groups = [[smi.replace(fragment_bond, '.') for smi in group] for group in groups]
+            groups = [[smi.replace('.', fragment_bond) for smi in group] for group in groups]
+        return '>'.join('.'.join(group) for group in groups)
+
 
-        return cls(*groups)
+def split_reaction_string(
+    reaction_string: str, fragment_bond: Optional[str]
+) -> List[Tuple[str, ...]]:
+    """
+    Split an "rxn" reaction SMILES into the SMILES strings of the reactants,
+    agents and products (empty tuples for empty groups), with the fragment
+    bonds replaced by dots.
+
+    Raises:
+        InvalidReactionSmiles if the string does not contain exactly two ">".
+    """
+    groups = [
+        tuple(smiles_group.split('.')) if smiles_group else ()
+        for smiles_group in reaction_string.split('>')
+    ]
+    if len(groups) != 3:
+        raise InvalidReactionSmiles(reaction_string)
+    # The fragment bonds are replaced after splitting, since they become dots
+    if fragment_bond is not None and fragment_bond in reaction_string:
+        groups = [tuple(smi.replace(fragment_bond, '.') for smi in group) for group in groups]
+    return groups
 
 
 def colorblind_color_palette(n: int) -> List[str]:
@@ -134,6 +198,15 @@ def iterate_lines_from_file(filename: Union[Path, str]) -> Generator[str, None,
             yield line.strip()
 
 
+def iterate_tsv_pairs(filename: Union[Path, str]) -> Iterator[Tuple[str, str]]:
+    """Iterate over the two first columns of a TSV file, skipping malformed lines."""
+    for line in iterate_lines_from_file(filename):
+        columns = line.split('\t')
+        if len(columns) < 2:
+            continue
+        yield columns[0], columns[1]
+
+
 def detokenize_smiles(tokenized_smiles: str) -> str:
     """
     Detokenize a tokenized SMILES string (that contains spaces between the characters).
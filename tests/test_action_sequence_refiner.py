@@ -0,0 +1,20 @@
+from paragraph2actions.action_string_converter import ReadableConverter
+
+from smiles2actions.action_sequence_refiner import ActionSequenceRefiner
+
+
+def test_refine_many_workers_use_the_state_of_the_refiner():
+    converter = ReadableConverter(separator=' ; ', end_mark='')
+    actions_string = 'ADD ethanol ; STIR for 2 h at 25 °C ; CONCENTRATE ; YIELD ethyl acetate'
+    refiner = ActionSequenceRefiner()
+    refiner.temperature_resolver.table['25 °C'] = '#9#'
+
+    for n_jobs in (1, 2):
+        results = list(
+            refiner.refine_many(
+                (converter.string_to_actions(actions_string) for _ in range(3)), n_jobs=n_jobs
+            )
+        )
+        assert [converter.actions_to_string(r.actions) for r in results] == [
+            'ADD ethanol ; STIR for @2@ at #9# ; CONCENTRATE ; YIELD ethyl acetate'
+        ] * 3
@@ -0,0 +1,31 @@
+import threading
+from typing import List
+
+from smiles2actions.action_predictor import ActionPrediction, PredictedActions
+from smiles2actions.cached_action_predictor import CachedActionPredictor
+
+
+def _predict_many(reaction_smiles_list: List[str]) -> List[ActionPrediction]:
+    return [
+        ActionPrediction(
+            reaction_smiles=smiles,
+            candidates=[PredictedActions(raw='ADD $1$ ; YIELD $-1$', actions='', score=0.0)]
+        ) for smiles in reaction_smiles_list
+    ]
+
+
+def test_disk_cache_connections_do_not_grow_with_threads(tmp_path):
+    predictor = CachedActionPredictor(
+        _predict_many, cache_size=0, cache_file=tmp_path / 'cache.sqlite'
+    )
+    assert predictor._disk_cache is not None
+
+    for i in range(50):
+        # One short-lived thread per request, as in the prediction server
+        thread = threading.Thread(target=predictor.predict_many, args=([f'C{"C" * i}>>CO'], ))
+        thread.start()
+        thread.join()
+
+    assert predictor._disk_cache.number_connections() == 1
+    assert len(predictor._disk_cache) == 50
+    predictor.close()
@@ -0,0 +1,49 @@
+import io
+from typing import Dict
+
+from smiles2actions.dataset_builder import DatasetSampleProcessor, build_dataset
+from smiles2actions.name_to_smiles import NameToSmiles, NameToSmilesError
+
+
+class _DictNameToSmiles(NameToSmiles):
+
+    def __init__(self, mapping: Dict[str, str]):
+        self.mapping = mapping
+
+    def get_smiles(self, name: str) -> str:
+        try:
+            return self.mapping[name]
+        except KeyError:
+            raise NameToSmilesError(name)
+
+
+_actions = 'ADD ethanol ; STIR for 2 h at 25 °C ; CONCENTRATE ; PURIFY ; YIELD ethyl acetate'
+
+
+def _processor() -> DatasetSampleProcessor:
+    return DatasetSampleProcessor(
+        name_to_smiles=_DictNameToSmiles({'ethanol': 'CCO', 'ethyl acetate': 'CCOC(C)=O'}),
+        admissible_reagents=[]
+    )
+
+
+def test_malformed_reaction_is_rejected():
+    result = _processor().process('CC.C', _actions)
+
+    assert result.sample is None
+    assert result.rejection_reason == 'InvalidReactionSmiles'
+
+
+def test_malformed_reaction_does_not_abort_build_dataset():
+    src_file, tgt_file = io.StringIO(), io.StringIO()
+
+    counter = build_dataset(
+        [('CC.C', _actions), ('CCO>>CCOC(C)=O', _actions)],
+        processor_factory=_processor,
+        src_file=src_file,
+        tgt_file=tgt_file,
+    )
+
+    assert counter['InvalidReactionSmiles'] == 1
+    assert counter['accepted'] == 1
+    assert src_file.getvalue() == 'C C O >> C C O C ( C ) = O\n'